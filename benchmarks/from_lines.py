@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Compares `UnicodeDataEntry.from_lines` with the previous regex parser.
+
+Usage: python benchmarks/from_lines.py [-n REPEAT]
+"""
+
+import argparse
+import pathlib
+import re
+import timeit
+
+from unicodedata_reader import UnicodeDataEntry
+
+cache_dir = pathlib.Path(__file__).resolve().parent.parent / "tests" / "cache"
+
+
+def from_lines_regex(lines, converter=None, comment=None):
+    """The parser before the fast path, kept for comparison."""
+    for line in lines:
+        line = line.rstrip()
+        match = re.search(r"\s*#\s*(.*)", line)
+        if match:
+            start_index = match.start()
+            if comment:
+                comment(match.group(1), start_index)
+            line = line[0:start_index]
+        if not line:
+            continue
+        columns = re.split(r"\s*;\s*", line)
+        assert len(columns) >= 2
+        value = columns[1] if len(columns) == 2 else columns[1:]
+        if converter:
+            value = converter(value)
+        code = columns[0]
+        codeRange = code.split("..")
+        if len(codeRange) == 1:
+            code = int(code, 16)
+            yield UnicodeDataEntry(code, code, value)
+        elif len(codeRange) == 2:
+            yield UnicodeDataEntry(int(codeRange[0], 16), int(codeRange[1], 16), value)
+        else:
+            assert False
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    def comment(comment, start_index):
+        pass
+
+    print(f"{'File':<40} {'Lines':>6} {'Regex':>9} {'Fast':>9} {'Ratio':>6}")
+    # The source files have no suffixes; skip the parsed caches, locks, and
+    # compiled tables next to them.
+    paths = (
+        p
+        for p in cache_dir.rglob("*")
+        if p.is_file() and not p.suffix and not p.name.startswith(".")
+    )
+    for path in sorted(paths):
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        expected = tuple(from_lines_regex(lines))
+        actual = tuple(UnicodeDataEntry.from_lines(lines))
+        assert actual == expected, path
+
+        regex = min(
+            timeit.repeat(
+                lambda: tuple(from_lines_regex(lines, comment=comment)),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        fast = min(
+            timeit.repeat(
+                lambda: tuple(UnicodeDataEntry.from_lines(lines, comment=comment)),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        name = str(path.relative_to(cache_dir))
+        print(
+            f"{name:<40} {len(lines):>6} {regex * 1000:>7.1f}ms"
+            f" {fast * 1000:>7.1f}ms {regex / fast:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Measures the time to import `unicodedata_reader`.
+
+Usage: python benchmarks/import_time.py [-n REPEAT]
+
+Each statement runs in a new process with `-X importtime`, and the minimum of
+the cumulative import times is reported.
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+
+src_dir = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+statements = {
+    "import": "import unicodedata_reader",
+    "lookup": "import unicodedata_reader as u; u.UnicodeDataEntries",
+    "reader": "import unicodedata_reader as u; u.UnicodeDataReader",
+    "all": "from unicodedata_reader import *",
+}
+
+
+def import_time(statement):
+    """Returns the import time in microseconds, and the number of modules."""
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    result = subprocess.run(
+        (
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}; import sys; print(len(sys.modules))",
+        ),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        columns = line.split("|")
+        if len(columns) != 3 or not columns[1].strip().isdigit():
+            continue
+        # Count only top-level imports; nested ones are in their cumulative.
+        if not columns[2].startswith("  "):
+            total += int(columns[1])
+    return total, int(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Write `.pyc` files first, so that compiling is not measured.
+    import_time(statements["all"])
+    baseline = min(import_time("pass")[0] for _ in range(args.repeat))
+    print(f"{'Statement':<10} {'Time':>9} {'Modules':>8}")
+    for name, statement in statements.items():
+        results = [import_time(statement) for _ in range(args.repeat)]
+        time = min(result[0] for result in results) - baseline
+        print(f"{name:<10} {time / 1000:>7.1f}ms {results[0][1]:>8}")
+
+
+if __name__ == "__main__":
+    main()
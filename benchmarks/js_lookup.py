@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Compares the JavaScript templates and encoders in the "`js`" directory.
+
+Usage: python benchmarks/js_lookup.py [-n REPEAT] [PROPERTY...]
+
+Generates files from each template using `tests/cache`, and reports their
+sizes, and the time to initialize and to look up code points in `node`.
+"""
+
+import argparse
+import gzip
+import json
+import pathlib
+import subprocess
+import tempfile
+
+from unicodedata_reader import UnicodeDataCachedReader
+from unicodedata_reader import UnicodeDataCompressor
+
+root_dir = pathlib.Path(__file__).resolve().parent.parent
+cache_dir = root_dir / "tests" / "cache"
+templates = (
+    ("template.js", "varint"),
+    ("template-bsearch.js", "varint"),
+    ("template-2stage.js", "varint"),
+    ("template-packed.js", "packed"),
+    ("template-columns.js", "columns"),
+    ("template-blocks.js", "blocks"),
+)
+
+# Loads a generated file, and reports the time to initialize and to look up
+# the BMP, the CJK Unified Ideographs, and the supplementary planes.
+harness = """
+const fs = require("fs");
+const [path, name, repeat] = process.argv.slice(1);
+const source = fs.readFileSync(path, "utf8") + `;u${name}AsInt`;
+let t0 = performance.now();
+const asInt = (0, eval)(source);
+const init = performance.now() - t0;
+// Runs may end at U+10FFFD, the last code point with an explicit value.
+const ranges = {bmp: [0, 0x10000], cjk: [0x4E00, 0xA000], supp: [0x10000, 0x10FFFE]};
+const results = {init};
+let checksum = 0;
+for (const [key, [start, end]] of Object.entries(ranges)) {
+  let best = Infinity;
+  for (let r = 0; r < repeat; ++r) {
+    t0 = performance.now();
+    for (let c = start; c < end; ++c)
+      checksum += asInt(c);
+    best = Math.min(best, performance.now() - t0);
+  }
+  results[key] = best * 1e6 / (end - start);
+}
+results.checksum = checksum;
+console.log(JSON.stringify(results));
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("properties", nargs="*", default=["line_break"])
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    reader = UnicodeDataCachedReader(cache_dir=cache_dir)
+    print(
+        f"{'File':<28} {'Bytes':>6} {'Gzip':>6} {'Init':>8}"
+        f" {'BMP':>8} {'CJK':>8} {'Supp':>8}"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = pathlib.Path(temp_dir)
+        for property in args.properties:
+            entries = getattr(reader, property)()
+            entries.fill_missing_values()
+            entries.map_values_to_int()
+            checksums = set()
+            for template, encoder in templates:
+                compressor = UnicodeDataCompressor(entries, encoder=encoder)
+                text = compressor.substitute_template(
+                    root_dir / "js" / template, output=output
+                )
+                path = output / compressor._output_name(
+                    pathlib.Path(template), entries.name
+                )
+                result = json.loads(
+                    subprocess.run(
+                        (
+                            "node",
+                            "-e",
+                            harness,
+                            str(path),
+                            entries.name,
+                            str(args.repeat),
+                        ),
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    ).stdout
+                )
+                checksums.add(result["checksum"])
+                size = len(text.encode())
+                gzip_size = len(gzip.compress(text.encode()))
+                print(
+                    f"{path.name:<28} {size:>6} {gzip_size:>6}"
+                    f" {result['init']:>6.2f}ms"
+                    f" {result['bmp']:>6.1f}ns {result['cjk']:>6.1f}ns"
+                    f" {result['supp']:>6.1f}ns"
+                )
+            assert len(checksums) == 1 and None not in checksums, checksums
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+const u${NAME}AsInt = (function () {
+  const bytes = atob("$BASE64BYTES");
+  const len = bytes.length;
+  const counts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let end = 0;
+  let index = 0;
+  let value = 0;
+  for (let i = 0; i < len; ++i) {
+    const byte = bytes.charCodeAt(i);
+    if (byte & 0x80) {
+      value = (value | (byte & 0x7F)) << 7;
+      continue;
+    }
+    value |= byte;
+    counts[index] = (value >> $VALUE_BITS) + 1;
+    values[index] = value & $VALUE_MASK;
+    end += counts[index];
+    ++index;
+    value = 0;
+  }
+  // Split code points to blocks of `1 << SHIFT`. `stage1` has `~value` for a
+  // block of a single value, or the offset of the block in `stage2`.
+  const SHIFT = $SHIFT;
+  const BLOCK_SIZE = 1 << SHIFT;
+  const stage1 = new Int32Array((end + BLOCK_SIZE - 1) >> SHIFT);
+  let stage2 = new $VALUE_ARRAY(BLOCK_SIZE * 64);
+  let stage2Length = 0;
+  let run = 0;
+  let runEnd = counts[0];
+  for (let block = 0; block < stage1.length; ++block) {
+    const blockStart = block << SHIFT;
+    const blockEnd = blockStart + BLOCK_SIZE;
+    if (runEnd >= blockEnd) {
+      stage1[block] = ~values[run];
+    } else {
+      if (stage2Length + BLOCK_SIZE > stage2.length) {
+        const grown = new $VALUE_ARRAY(stage2.length * 2);
+        grown.set(stage2);
+        stage2 = grown;
+      }
+      stage1[block] = stage2Length;
+      for (let c = blockStart; c < blockEnd; ++c) {
+        while (c >= runEnd && run + 1 < index)
+          runEnd += counts[++run];
+        stage2[stage2Length++] = values[run];
+      }
+    }
+    while (runEnd <= blockEnd && run + 1 < index)
+      runEnd += counts[++run];
+  }
+  stage2 = stage2.slice(0, stage2Length);
+  return function (c) {
+    if (c < 0 || c >= end)
+      return undefined;
+    const i = stage1[c >> SHIFT];
+    return i < 0 ? ~i : stage2[i + (c & (BLOCK_SIZE - 1))];
+  }
+})();
+const u${NAME}Values = [$VALUE_LIST];
+function u${NAME}(c) { return u${NAME}Values[u${NAME}AsInt(c)]; }
@@ -0,0 +1,28 @@
+const u${NAME}AsInt = (function () {
+  const bytes = atob("$BASE64BYTES");
+  // `stage1` followed by `stage2` of a two-stage table, in little endian.
+  function read(array, offset) {
+    const size = array.BYTES_PER_ELEMENT;
+    for (let i = 0; i < array.length; ++i) {
+      let value = 0;
+      for (let j = size - 1; j >= 0; --j)
+        value = value * 256 + bytes.charCodeAt(offset + j);
+      array[i] = value;
+      offset += size;
+    }
+    return offset;
+  }
+  const SHIFT = $BLOCK_SHIFT;
+  const MASK = (1 << SHIFT) - 1;
+  const stage1 = new $STAGE1_ARRAY($STAGE1_LENGTH);
+  const offset = read(stage1, 0);
+  const stage2 = new $VALUE_ARRAY((bytes.length - offset) / $VALUE_ARRAY.BYTES_PER_ELEMENT);
+  read(stage2, offset);
+  return function (c) {
+    if (c < 0 || c > 0x10FFFF)
+      return undefined;
+    return stage2[(stage1[c >> SHIFT] << SHIFT) | (c & MASK)];
+  }
+})();
+const u${NAME}Values = [$VALUE_LIST];
+function u${NAME}(c) { return u${NAME}Values[u${NAME}AsInt(c)]; }
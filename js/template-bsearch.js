@@ -0,0 +1,39 @@
+const u${NAME}AsInt = (function () {
+  const bytes = atob("$BASE64BYTES");
+  const len = bytes.length;
+  // The start code point and the value of each run, for binary search.
+  const starts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let start = 0;
+  let index = 0;
+  let value = 0;
+  for (let i = 0; i < len; ++i) {
+    const byte = bytes.charCodeAt(i);
+    if (byte & 0x80) {
+      value = (value | (byte & 0x7F)) << 7;
+      continue;
+    }
+    value |= byte;
+    starts[index] = start;
+    values[index] = value & $VALUE_MASK;
+    start += (value >> $VALUE_BITS) + 1;
+    ++index;
+    value = 0;
+  }
+  return function (c) {
+    if (c < 0 || c >= start)
+      return undefined;
+    let low = 0;
+    let high = index - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (starts[mid] <= c)
+        low = mid;
+      else
+        high = mid - 1;
+    }
+    return values[low];
+  }
+})();
+const u${NAME}Values = [$VALUE_LIST];
+function u${NAME}(c) { return u${NAME}Values[u${NAME}AsInt(c)]; }
@@ -0,0 +1,44 @@
+const u${NAME}AsInt = (function () {
+  const bytes = atob("$BASE64BYTES");
+  // `count - 1` of all runs in variable length integers, followed by values of
+  // all runs in little endian.
+  const starts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let offset = 0;
+  let start = 0;
+  for (let index = 0; index < $ENTRY_COUNT; ++index) {
+    let count = 0;
+    for (;;) {
+      const byte = bytes.charCodeAt(offset++);
+      count = count * 128 + (byte & 0x7F);
+      if (!(byte & 0x80))
+        break;
+    }
+    starts[index] = start;
+    start += count + 1;
+  }
+  const valueSize = values.BYTES_PER_ELEMENT;
+  for (let index = 0; index < $ENTRY_COUNT; ++index) {
+    let value = 0;
+    for (let i = valueSize - 1; i >= 0; --i)
+      value = value * 256 + bytes.charCodeAt(offset + i);
+    values[index] = value;
+    offset += valueSize;
+  }
+  return function (c) {
+    if (c < 0 || c >= start)
+      return undefined;
+    let low = 0;
+    let high = $ENTRY_COUNT - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (starts[mid] <= c)
+        low = mid;
+      else
+        high = mid - 1;
+    }
+    return values[low];
+  }
+})();
+const u${NAME}Values = [$VALUE_LIST];
+function u${NAME}(c) { return u${NAME}Values[u${NAME}AsInt(c)]; }
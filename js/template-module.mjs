@@ -0,0 +1,69 @@
+// The data is in "$BINARY_FILE", generated with this file. It is fetched and
+// decoded by the first call of `load()`.
+let asInt;
+let loading;
+
+function decode(bytes) {
+  const len = bytes.length;
+  // The start code point and the value of each run, for binary search.
+  const starts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let start = 0;
+  let index = 0;
+  let value = 0;
+  for (let i = 0; i < len; ++i) {
+    const byte = bytes[i];
+    if (byte & 0x80) {
+      value = (value | (byte & 0x7F)) << 7;
+      continue;
+    }
+    value |= byte;
+    starts[index] = start;
+    values[index] = value & $VALUE_MASK;
+    start += (value >> $VALUE_BITS) + 1;
+    ++index;
+    value = 0;
+  }
+  return function (c) {
+    if (c < 0 || c >= start)
+      return undefined;
+    let low = 0;
+    let high = index - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (starts[mid] <= c)
+        low = mid;
+      else
+        high = mid - 1;
+    }
+    return values[low];
+  }
+}
+
+// Loads the data. `url` is the URL of "$BINARY_FILE", next to this module by
+// default. Returns a promise of `u${NAME}`.
+export function load(url = new URL("$BINARY_FILE", import.meta.url)) {
+  if (!loading) {
+    loading = fetch(url).then(response => {
+      if (!response.ok)
+        throw new Error("Failed to load " + url + ": " + response.status);
+      return response.arrayBuffer();
+    }).then(buffer => {
+      if (buffer.byteLength !== $BYTE_COUNT)
+        throw new Error(url + " is not the data for this module");
+      asInt = decode(new Uint8Array(buffer));
+      return u${NAME};
+    });
+  }
+  return loading;
+}
+
+const values = [$VALUE_LIST];
+
+export function u${NAME}AsInt(c) {
+  if (!asInt)
+    throw new Error("The data is not loaded; call load() first");
+  return asInt(c);
+}
+
+export function u${NAME}(c) { return values[u${NAME}AsInt(c)]; }
@@ -0,0 +1,61 @@
+const u${NAME} = (function () {
+  const bytes = atob("$BASE64BYTES");
+  const len = bytes.length;
+  // The start code point and the combined value of each run, for binary
+  // search. A combined value is an index to `combos`.
+  const starts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let start = 0;
+  let index = 0;
+  let value = 0;
+  for (let i = 0; i < len; ++i) {
+    const byte = bytes.charCodeAt(i);
+    if (byte & 0x80) {
+      value = (value | (byte & 0x7F)) << 7;
+      continue;
+    }
+    value |= byte;
+    starts[index] = start;
+    values[index] = value & $VALUE_MASK;
+    start += (value >> $VALUE_BITS) + 1;
+    ++index;
+    value = 0;
+  }
+  const names = $PROPERTY_NAMES;
+  const valueLists = $PROPERTY_VALUES;
+  const count = names.length;
+  const combos = $COMBOS;
+  function asInt(c) {
+    if (c < 0 || c >= start)
+      return undefined;
+    let low = 0;
+    let high = index - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (starts[mid] <= c)
+        low = mid;
+      else
+        high = mid - 1;
+    }
+    return values[low] * count;
+  }
+  // Returns an object of values of all properties.
+  function lookup(c) {
+    const i = asInt(c);
+    if (i === undefined)
+      return undefined;
+    const result = {};
+    for (let p = 0; p < count; ++p)
+      result[names[p]] = valueLists[p][combos[i + p]];
+    return result;
+  }
+  // Accessors of each property, such as `u${NAME}.LineBreak(c)`.
+  names.forEach((name, p) => {
+    const list = valueLists[p];
+    lookup[name] = function (c) {
+      const i = asInt(c);
+      return i === undefined ? undefined : list[combos[i + p]];
+    };
+  });
+  return lookup;
+})();
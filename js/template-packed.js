@@ -0,0 +1,39 @@
+const u${NAME}AsInt = (function () {
+  const bytes = atob("$BASE64BYTES");
+  // The first byte is the number of bits for counts. Then each run has
+  // `count - 1` in $COUNT_BITS bits and the value in $VALUE_BITS bits, packed
+  // from the most significant bit.
+  const starts = new Uint32Array($ENTRY_COUNT);
+  const values = new $VALUE_ARRAY($ENTRY_COUNT);
+  let bitOffset = 8;
+  function read(bits) {
+    let value = 0;
+    for (let i = 0; i < bits; ++i, ++bitOffset) {
+      const byte = bytes.charCodeAt(bitOffset >> 3);
+      value = value * 2 + ((byte >> (7 - (bitOffset & 7))) & 1);
+    }
+    return value;
+  }
+  let start = 0;
+  for (let index = 0; index < $ENTRY_COUNT; ++index) {
+    starts[index] = start;
+    start += read($COUNT_BITS) + 1;
+    values[index] = read($VALUE_BITS);
+  }
+  return function (c) {
+    if (c < 0 || c >= start)
+      return undefined;
+    let low = 0;
+    let high = $ENTRY_COUNT - 1;
+    while (low < high) {
+      const mid = (low + high + 1) >> 1;
+      if (starts[mid] <= c)
+        low = mid;
+      else
+        high = mid - 1;
+    }
+    return values[low];
+  }
+})();
+const u${NAME}Values = [$VALUE_LIST];
+function u${NAME}(c) { return u${NAME}Values[u${NAME}AsInt(c)]; }
@@ -1,10 +1,89 @@
+import importlib
+from typing import TYPE_CHECKING
+
 try:
     from ._version import version as __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
 
-from .entry import *
-from .reader import *
-from .compressor import *
-from .cli import *
-from .set import *
+# Public names, and the modules that define them. Modules are imported when
+# their names are first used, so that importing this package is fast, and does
+# not import modules such as `argparse` unless they are needed.
+_names_for_module = {
+    "entry": (
+        "u_hex",
+        "u_enc",
+        "BidiBrackets",
+        "EmojiType",
+        "UnicodeDataEntry",
+        "UnicodeDataEntries",
+        "UnicodeBidiBracketsDataEntries",
+        "UnicodeEmojiDataEntries",
+        "UnicodeGeneralCategoryDataEntries",
+        "UnicodeLineBreakDataEntries",
+        "UnicodeScriptExtensionsDataEntries",
+        "UnicodeVerticalOrientationDataEntries",
+    ),
+    "reader": (
+        "UnicodeDataReader",
+        "UnicodeDataCachedReader",
+        "UnicodeDataZipReader",
+        "UnicodeDataMemoizedReader",
+        "UnicodeDataCompiledReader",
+    ),
+    "compressor": (
+        "UnicodeDataCompressor",
+        "UnicodeDataEncoder",
+        "UnicodeDataVarintEncoder",
+        "UnicodeDataPackedEncoder",
+        "UnicodeDataColumnsEncoder",
+        "UnicodeDataBlocksEncoder",
+        "UnicodeDataEncodedSize",
+        "main",
+    ),
+    "cli": (
+        "to_unicodes",
+        "get_unicodes_from_args",
+        "u_printable_chr",
+        "u_name_or_empty",
+        "UnicodeDataCli",
+    ),
+    "set": ("Set",),
+    "compiled": ("UnicodeDataCompiledEntries",),
+    "snapshot": ("UnicodeDataSnapshot",),
+    "generate": ("UnicodeDataGenerator",),
+    "async_reader": (
+        "AsyncUnicodeDataReader",
+        "AsyncUnicodeDataCachedReader",
+    ),
+}
+_module_for_name = {
+    name: module for module, names in _names_for_module.items() for name in names
+}
+
+__all__ = list(_module_for_name)
+
+
+def __getattr__(name: str):
+    module = _module_for_name.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from .entry import *
+    from .reader import *
+    from .compressor import *
+    from .cli import *
+    from .set import *
+    from .compiled import *
+    from .snapshot import *
+    from .generate import *
+    from .async_reader import *
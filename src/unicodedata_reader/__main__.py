@@ -5,7 +5,9 @@ import unicodedata_reader.bidi_brackets as bidi_brackets
 import unicodedata_reader.east_asian_width as ea
 import unicodedata_reader.emoji as emoji
 import unicodedata_reader.general_category as gc
+import unicodedata_reader.generate as generate
 import unicodedata_reader.line_break as lb
+import unicodedata_reader.snapshot as snapshot
 import unicodedata_reader.vertical_orientation as vo
 
 
@@ -16,7 +18,9 @@ def main():
         "ea": lambda: ea.UnicodeEastAsianWidthDataCli().main(),
         "emoji": lambda: emoji.UnicodeEmojiDataCli().main(),
         "gc": lambda: gc.UnicodeGeneralCategoryDataCli().main(),
+        "generate": lambda: generate.main(),
         "lb": lambda: lb.UnicodeLineBreakDataCli().main(),
+        "snapshot": lambda: snapshot.main(),
         "vo": lambda: vo.UnicodeVerticalOrientationDataCli().main(),
     }
     if len(args) > 1:
@@ -0,0 +1,162 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Type
+
+from .entry import *
+from .reader import UnicodeDataCachedReader
+from .reader import UnicodeDataReader
+
+_logger = logging.getLogger("AsyncUnicodeDataReader")
+
+
+class AsyncUnicodeDataReader(object):
+    """Reads [Unicode character database] data files without blocking the
+    event loop.
+
+    Downloading, file I/O, and parsing run in `executor` by `reader`, and the
+    accessors return awaitables:
+    ```python
+    reader = AsyncUnicodeDataReader()
+    lb = await reader.line_break()
+    ```
+    Concurrent requests for the same file share one request, and each caller
+    gets a `copy()` of the entries.
+
+    [Unicode character database]: https://unicode.org/reports/tr44/
+    """
+
+    def __init__(
+        self,
+        reader: Optional[UnicodeDataReader] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        self._reader = reader or UnicodeDataReader()
+        self._executor = executor
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._reader.version
+
+    async def bidi_brackets(self) -> UnicodeDataEntries:
+        return await self._read_property("bidi_brackets")
+
+    async def blocks(self) -> UnicodeDataEntries:
+        return await self._read_property("blocks")
+
+    async def east_asian_width(self) -> UnicodeDataEntries:
+        return await self._read_property("east_asian_width")
+
+    async def emoji(self) -> UnicodeDataEntries:
+        return await self._read_property("emoji")
+
+    async def general_category(self) -> UnicodeDataEntries:
+        return await self._read_property("general_category")
+
+    async def line_break(self) -> UnicodeDataEntries:
+        return await self._read_property("line_break")
+
+    async def name(self) -> UnicodeDataEntries:
+        return await self._read_property("name")
+
+    async def scripts(self) -> UnicodeDataEntries:
+        return await self._read_property("scripts")
+
+    async def script_extensions(self) -> UnicodeDataEntries:
+        return await self._read_property("script_extensions")
+
+    async def vertical_orientation(self) -> UnicodeDataEntries:
+        return await self._read_property("vertical_orientation")
+
+    async def read_entries(
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries] = UnicodeDataEntries,
+        entries_name: Optional[str] = None,
+    ) -> UnicodeDataEntries:
+        """Reads the file `name` and parses it into `entries_class`.
+
+        `entries_name` is the `name` of the entries. It is `name` if omitted.
+        """
+        entries = await self._run_once(
+            ("read_entries", name, entries_class, entries_name),
+            functools.partial(
+                self._parse,
+                self._reader.read_entries,
+                name,
+                entries_class,
+                entries_name,
+            ),
+        )
+        return entries.copy()
+
+    async def read_lines(self, name: str) -> List[str]:
+        lines = await self._run_once(
+            ("read_lines", name),
+            lambda: list(self._reader.read_lines(name)),
+        )
+        return list(lines)
+
+    async def load_many(
+        self, properties: Iterable[str]
+    ) -> Dict[str, UnicodeDataEntries]:
+        """Loads entries concurrently, and returns a `dict` of them.
+
+        `properties` are the names of the methods such as `"line_break"`.
+        """
+        properties = list(dict.fromkeys(properties))
+        results = await asyncio.gather(
+            *(getattr(self, property)() for property in properties)
+        )
+        return dict(zip(properties, results))
+
+    async def _read_property(self, property: str) -> UnicodeDataEntries:
+        entries = await self._run_once(
+            property, functools.partial(self._parse, getattr(self._reader, property))
+        )
+        return entries.copy()
+
+    @staticmethod
+    def _parse(func: Callable[..., UnicodeDataEntries], *args) -> UnicodeDataEntries:
+        entries = func(*args)
+        # Resolve lazy states in the executor, not in the event loop.
+        entries.missing_entries()
+        return entries
+
+    async def _run_once(self, key: Hashable, func: Callable):
+        """Runs `func` in the executor, or waits for the running one if there
+        is one for the `key`."""
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, func)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            _logger.debug("Waiting for %s", key)
+        # Cancelling one of the callers should not cancel others.
+        return await asyncio.shield(future)
+
+
+class AsyncUnicodeDataCachedReader(AsyncUnicodeDataReader):
+    """`AsyncUnicodeDataReader` with `UnicodeDataCachedReader`.
+
+    Reading and writing the cache also run in `executor`.
+    """
+
+    def __init__(
+        self,
+        reader: Optional[UnicodeDataReader] = None,
+        cache_dir: Optional[Path] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        super().__init__(UnicodeDataCachedReader(reader, cache_dir), executor)
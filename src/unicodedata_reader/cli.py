@@ -85,8 +85,12 @@ class UnicodeDataCli(object):
     text: Optional[Sequence[str]]
     clear_cache: bool
     no_cache: bool
+    ucd_version: Optional[str]
     name: Optional[str]
     template: Optional[pathlib.Path]
+    encoder: Optional[str]
+    report: bool
+    binary: bool
     output: Optional[pathlib.Path]
     verbose: int
     _entries: UnicodeDataEntries
@@ -133,25 +137,67 @@ class UnicodeDataCli(object):
             except UnicodeEncodeError:
                 continue
 
-    def substitute_template(self, template: pathlib.Path, output: pathlib.Path):
+    def _compressor(self, encoder: Optional[str] = None) -> UnicodeDataCompressor:
         entries = self._entries
         entries.fill_missing_values()
         entries.map_values_to_int()
+        return UnicodeDataCompressor(
+            entries, encoder=encoder or self.encoder or "varint"
+        )
+
+    def substitute_template(self, template: pathlib.Path, output: pathlib.Path):
+        encoder = self.encoder
+        if encoder in (None, "auto") and not template.is_dir():
+            # A template decodes only its encoder.
+            encoder = UnicodeDataCompressor.encoder_for_template(template) or encoder
+        if encoder == "auto" and self.binary:
+            encoder = "varint"
+        compressor = self._compressor(encoder)
+        if template.is_dir():
+            if self.binary and compressor.encoder.binary_template:
+                template = template / compressor.encoder.binary_template
+            else:
+                template = template / compressor.encoder.template
         output = output if output else template.parent
-        compressor = UnicodeDataCompressor(entries)
-        compressor.substitute_template(template, name=self.name, output=output)
+        compressor.substitute_template(
+            template, name=self.name, output=output, binary=self.binary
+        )
+
+    def print_report(self):
+        print("Encoder\tBytes\tBase64\tGzip")
+        for size in self._compressor().report():
+            print(f"{size.encoder}\t{size.raw}\t{size.base64}\t{size.gzip}")
 
     def _parse_args(self):
         parser = argparse.ArgumentParser()
         parser.add_argument("text", nargs="*", help="show properties for the text")
         parser.add_argument("-f", "--clear-cache", action="store_true")
         parser.add_argument("-F", "--no-cache", action="store_true")
+        parser.add_argument(
+            "--ucd-version", help="the Unicode version such as 15.0.0 (latest)"
+        )
         parser.add_argument("--name", help="$NAME in the template")
         parser.add_argument(
             "-t",
             "--template",
             type=pathlib.Path,
-            help="generate a file from the template",
+            help="generate a file from the template, or from the template of"
+            " the encoder in the directory",
+        )
+        parser.add_argument(
+            "-e",
+            "--encoder",
+            choices=(*UnicodeDataCompressor.encoders, "auto"),
+            help="the encoder for the template, or auto for the smallest"
+            " (the encoder the template decodes, or varint)",
+        )
+        parser.add_argument(
+            "--report", action="store_true", help="show sizes of all encoders"
+        )
+        parser.add_argument(
+            "--binary",
+            action="store_true",
+            help="save the data to a separate .bin file, for template-module.mjs",
         )
         parser.add_argument("-o", "--output", type=pathlib.Path)
         parser.add_argument(
@@ -169,9 +215,16 @@ class UnicodeDataCli(object):
         if self.clear_cache:
             UnicodeDataCachedReader.clear_cache()
         if self.no_cache:
-            UnicodeDataReader.default = UnicodeDataReader()
+            UnicodeDataReader.default = UnicodeDataReader(version=self.ucd_version)
+        elif self.ucd_version:
+            UnicodeDataReader.default = UnicodeDataCachedReader(
+                UnicodeDataReader(version=self.ucd_version)
+            )
 
     def main(self):
+        if self.report:
+            self.print_report()
+            return
         if self.template:
             self.substitute_template(self.template, self.output)
             return
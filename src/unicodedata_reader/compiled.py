@@ -0,0 +1,348 @@
+from array import array
+import json
+import mmap
+import os
+from pathlib import Path
+import itertools
+import struct
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from .entry import UnicodeDataEntries
+from .entry import UnicodeDataEntry
+from .entry import _hashable
+from .entry import _value_from_json
+from .entry import _value_to_json
+
+
+# The header of the binary format; the magic, the format version, `shift`, the
+# typecodes of `stage1` and `stage2`, their lengths, and the length of the
+# trailer. Arrays are in little endian, and aligned to 4 bytes. The trailer is
+# the JSON of the name, the value table, and the key.
+_header = struct.Struct("<4sBBcc4xIII")
+_magic = b"UCDT"
+_format_version = 2
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _typecode_of(stage: Sequence[int]) -> str:
+    if isinstance(stage, memoryview):
+        return stage.format
+    return stage.typecode  # type: ignore[attr-defined]
+
+
+def _typecode_for(max_value: int) -> str:
+    for typecode in ("B", "H", "I"):
+        if max_value < (1 << (8 * array(typecode).itemsize)):
+            return typecode
+    assert False
+
+
+class UnicodeDataCompiledEntries(object):
+    """A two-stage lookup table compiled from `UnicodeDataEntries`.
+
+    The Unicode code space is split into blocks of `1 << shift` code points.
+    Identical blocks are stored only once in `stage2`, and `stage1` maps the
+    upper bits of a code point to the index of its block. A lookup is then two
+    array reads without any search.
+
+    Values are stored as _integer values_ as in `map_values_to_int()`, and
+    missing values are filled as in `fill_missing_values()`.
+    Use `UnicodeDataEntries.compile()` to create an instance.
+
+    Iterating, `filter()`, and `unicodes()` walk runs of values in the tables,
+    as `UnicodeDataEntries` with missing values filled. Code points whose
+    values are `None` are not included.
+    """
+
+    def __init__(
+        self,
+        stage1: Sequence[int],
+        stage2: Sequence[int],
+        values_for_int: List[Any],
+        shift: int,
+        name: Optional[str] = None,
+    ):
+        self.name = name
+        self._stage1 = stage1
+        self._stage2 = stage2
+        self._values_for_int = values_for_int
+        self._shift = shift
+        self._mask = (1 << shift) - 1
+        self._key: Any = None
+
+    @staticmethod
+    def from_entries(
+        entries: UnicodeDataEntries, shift: int = 7
+    ) -> "UnicodeDataCompiledEntries":
+        assert 0 < shift < 16
+        entries = entries.copy()
+        if not entries._is_sorted():
+            entries.sort()
+        if entries.values_for_int() is None:
+            entries.fill_missing_values()
+            entries.map_values_to_int()
+        values_for_int = list(entries.values_for_int())
+        index_for_value: Dict[Any, int] = {}
+
+        def int_for_value(value: Any) -> int:
+            key = _hashable(value)
+            index = index_for_value.get(key)
+            if index is None:
+                try:
+                    index = values_for_int.index(value)
+                except ValueError:
+                    index = len(values_for_int)
+                    values_for_int.append(value)
+                index_for_value[key] = index
+            return index
+
+        # Build a flat table of all code points, including code points not in
+        # the entries, then split it into blocks.
+        runs = []
+        missing_entries = entries._missing_entries_for_ranges()
+
+        def add_missing_runs(first: int, last: int) -> None:
+            for entry in entries._missing_entries_in(first, last, missing_entries):
+                runs.append((int_for_value(entry.value), entry.count))
+
+        next = 0
+        for entry in entries:
+            if entry.min > next:
+                add_missing_runs(next, entry.min - 1)
+            runs.append((entry.value, entry.count))
+            next = entry.max + 1
+        if next <= UnicodeDataEntry.max_code_point:
+            add_missing_runs(next, UnicodeDataEntry.max_code_point)
+        typecode = _typecode_for(len(values_for_int) - 1)
+        table = array(typecode)
+        for value, count in runs:
+            table.extend(array(typecode, (value,)) * count)
+
+        block_size = 1 << shift
+        table.extend(array(typecode, (0,)) * (-len(table) % block_size))
+        blocks: Dict[bytes, int] = {}
+        stage2 = array(typecode)
+        stage1_list = []
+        for start in range(0, len(table), block_size):
+            block = table[start : start + block_size]
+            key = block.tobytes()
+            index = blocks.get(key)
+            if index is None:
+                index = blocks[key] = len(blocks)
+                stage2.extend(block)
+            stage1_list.append(index)
+        stage1 = array(_typecode_for(len(blocks) - 1), stage1_list)
+        return UnicodeDataCompiledEntries(
+            stage1, stage2, values_for_int, shift, name=entries.name
+        )
+
+    def tobytes(self, key: Any = None) -> bytes:
+        """Returns the binary format of this table that `load()` can read.
+
+        `key` is stored in the binary, and `load()` sets it to `_key`. It must
+        be a JSON value; tuples are loaded as lists.
+        """
+        stage1 = array(_typecode_of(self._stage1), self._stage1)
+        stage2 = array(_typecode_of(self._stage2), self._stage2)
+        if sys.byteorder != "little":
+            stage1.byteswap()
+            stage2.byteswap()
+        trailer = json.dumps(
+            {
+                "name": self.name,
+                "values": [_value_to_json(value) for value in self._values_for_int],
+                "key": key,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header = _header.pack(
+            _magic,
+            _format_version,
+            self._shift,
+            stage1.typecode.encode(),
+            stage2.typecode.encode(),
+            len(stage1),
+            len(stage2),
+            len(trailer),
+        )
+        chunks = []
+        offset = 0
+        for chunk in (header, stage1.tobytes(), stage2.tobytes()):
+            chunks.append(chunk)
+            offset += len(chunk)
+            padding = _align(offset) - offset
+            chunks.append(bytes(padding))
+            offset += padding
+        chunks.append(trailer)
+        return b"".join(chunks)
+
+    def save(self, path: Union[str, Path], key: Any = None) -> None:
+        """Writes the binary format of this table to `path`."""
+        Path(path).write_bytes(self.tobytes(key))
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> "UnicodeDataCompiledEntries":
+        """Loads a table written by `save()`.
+
+        The file is memory-mapped read-only, and lookups read the mapped
+        memory directly. Processes loading the same file share one physical
+        copy of the tables, and loading does not read the whole file.
+        """
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _header.size:
+                raise ValueError(f"{path} is not a compiled table")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return UnicodeDataCompiledEntries._from_buffer(buffer, path)
+
+    @staticmethod
+    def frombytes(data: bytes) -> "UnicodeDataCompiledEntries":
+        """Creates a table from the result of `tobytes()`."""
+        return UnicodeDataCompiledEntries._from_buffer(data, "data")
+
+    @staticmethod
+    def _from_buffer(buffer, path: Any) -> "UnicodeDataCompiledEntries":
+        (
+            magic,
+            format_version,
+            shift,
+            typecode1,
+            typecode2,
+            length1,
+            length2,
+            trailer_length,
+        ) = _header.unpack_from(buffer, 0)
+        if magic != _magic or format_version != _format_version:
+            raise ValueError(f"{path} is not a compiled table of a supported format")
+        view = memoryview(buffer)
+        stages = []
+        offset = _align(_header.size)
+        for typecode, length in ((typecode1, length1), (typecode2, length2)):
+            typecode = typecode.decode()
+            size = length * array(typecode).itemsize
+            stage = view[offset : offset + size]
+            if sys.byteorder == "little":
+                stages.append(stage.cast(typecode))
+            else:
+                stage = array(typecode, stage.tobytes())
+                stage.byteswap()
+                stages.append(stage)
+            offset = _align(offset + size)
+        trailer = json.loads(bytes(view[offset : offset + trailer_length]))
+        values_for_int = [_value_from_json(value) for value in trailer["values"]]
+        compiled = UnicodeDataCompiledEntries(
+            stages[0], stages[1], values_for_int, shift, name=trailer["name"]
+        )
+        compiled._key = trailer["key"]
+        return compiled
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the lookup tables."""
+        return (
+            len(self._stage1) * self._stage1.itemsize
+            + len(self._stage2) * self._stage2.itemsize
+        )
+
+    def __getitem__(self, code: int) -> Any:
+        return self.value(code)
+
+    def value_as_int(self, code: int) -> int:
+        """Returns the _integer value_ for the given code point."""
+        return self._stage2[
+            (self._stage1[code >> self._shift] << self._shift) | (code & self._mask)
+        ]
+
+    def value(self, code: int) -> Any:
+        """Returns the value for the given code point."""
+        if code < 0 or code > UnicodeDataEntry.max_code_point:
+            return None
+        return self._values_for_int[self.value_as_int(code)]
+
+    def values(self, codes: Iterable[int]) -> List[Any]:
+        """Returns a list of values for the given code points."""
+        stage1 = self._stage1
+        stage2 = self._stage2
+        shift = self._shift
+        mask = self._mask
+        values_for_int = self._values_for_int
+        max_code_point = UnicodeDataEntry.max_code_point
+        return [
+            values_for_int[stage2[(stage1[code >> shift] << shift) | (code & mask)]]
+            if 0 <= code <= max_code_point
+            else None
+            for code in codes
+        ]
+
+    def values_for_str(self, text: str) -> List[Any]:
+        """Returns a list of values for each character in the string."""
+        return self.values(map(ord, text))
+
+    def values_for_int(self) -> List[Any]:
+        """Returns a list of values whose index is the _integer value_."""
+        return self._values_for_int
+
+    def _runs(self) -> Iterator[Tuple[int, int, int]]:
+        """Returns runs of `(min, max, integer value)` of all code points."""
+        stage2 = self._stage2
+        block_size = 1 << self._shift
+        # Compute runs of each block once. Identical blocks are common.
+        runs_for_block: Dict[int, List[Tuple[int, int]]] = {}
+        start = 0
+        run_min = 0
+        run_value = None
+        for block in self._stage1:
+            runs = runs_for_block.get(block)
+            if runs is None:
+                offset = block * block_size
+                runs = runs_for_block[block] = [
+                    (value, len(list(group)))
+                    for value, group in itertools.groupby(
+                        stage2[offset : offset + block_size]
+                    )
+                ]
+            for value, count in runs:
+                if value != run_value:
+                    if run_value is not None:
+                        yield run_min, start - 1, run_value
+                    run_min = start
+                    run_value = value
+                start += count
+        if run_value is not None:
+            yield run_min, min(start - 1, UnicodeDataEntry.max_code_point), run_value
+
+    def __iter__(self) -> Iterator[UnicodeDataEntry]:
+        values_for_int = self._values_for_int
+        for min, max, value in self._runs():
+            value = values_for_int[value]
+            if value is not None:
+                yield UnicodeDataEntry(min, max, value)
+
+    def filter(self, pred: Callable[[Any], bool]) -> Iterable[UnicodeDataEntry]:
+        """Returns an `Iterable` of `UnicodeDataEntry` for the given `pred`."""
+        return (entry for entry in self if pred(entry.value))
+
+    def unicodes(self) -> Iterable[int]:
+        """Returns a list of Unicode code points that have values."""
+        return itertools.chain(*(entry.range() for entry in self))
+
+    def to_dict(self) -> Dict[int, Any]:
+        """Returns a `dict` of values with a Unicode code point as the key."""
+        dict = {}
+        for entry in self:
+            for code in entry.range():
+                dict[code] = entry.value
+        return dict
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+from array import array
 import base64
+import gzip
+import itertools
+import json
 import logging
 import pathlib
+import re
 import string
 import sys
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
 
 from .entry import UnicodeDataEntries
+from .entry import UnicodeDataEntry
 from .reader import UnicodeDataReader
 
 _logger = logging.getLogger("UnicodeDataCompressor")
@@ -22,9 +36,415 @@ def _init_logging(verbose: int):
     logging.basicConfig(level=logging.DEBUG)
 
 
+def _bitsize_for(value: int) -> int:
+    bits = 0
+    while value:
+        bits += 1
+        value >>= 1
+    return bits
+
+
+def _to_varint(value: int) -> bytearray:
+    bytes = bytearray()
+    while value >= 0x80:
+        bytes.append(value & 0x7F)
+        value >>= 7
+    bytes.append(value)
+    bytes.reverse()
+    for i in range(0, len(bytes) - 1):
+        bytes[i] |= 0x80
+    return bytes
+
+
+# A variable length integer; bytes with the continuation bit, and a byte
+# without it.
+_varint = re.compile(rb"[\x80-\xff]*[\x00-\x7f]")
+# Clears the continuation bit.
+_clear_msb = bytes(b & 0x7F for b in range(256))
+
+
+def _from_varints(data: bytes, count: Optional[int] = None) -> Tuple[List[int], int]:
+    """Decodes `count` or all variable length integers in `data`.
+
+    Returns the integers and the number of bytes read.
+    """
+    # Split by the regular expression, and convert each distinct integer once.
+    # Runs of the same lengths and values are common.
+    tokens = _varint.findall(data)
+    if count is not None:
+        if len(tokens) < count:
+            raise ValueError(f"Expected {count} integers, found {len(tokens)}")
+        del tokens[count:]
+    value_for_token = dict.fromkeys(tokens)
+    for token in value_for_token:
+        value = 0
+        for digit in token.translate(_clear_msb):
+            value = (value << 7) | digit
+        value_for_token[token] = value
+    return list(map(value_for_token.__getitem__, tokens)), sum(map(len, tokens))
+
+
+def _fixed_typecode(bits: int) -> str:
+    return "B" if bits <= 8 else "H" if bits <= 16 else "I"
+
+
+def _to_fixed(values: List[int], bits: int) -> bytes:
+    # Little endian, 1, 2, or 4 bytes for each value.
+    result = array(_fixed_typecode(bits), values)
+    if sys.byteorder != "little":
+        result.byteswap()
+    return result.tobytes()
+
+
+def _from_fixed(data: bytes, bits: int) -> array:
+    result = array(_fixed_typecode(bits))
+    result.frombytes(data)
+    if sys.byteorder != "little":
+        result.byteswap()
+    return result
+
+
+class UnicodeDataEncoder(object):
+    """The base class of encoders of `UnicodeDataCompressor`.
+
+    An encoder encodes entries, with values mapped to _integer values_ and
+    without missing values, into bytes. The `template` file in the "`js`"
+    directory decodes them, and so do the files in `templates` if any.
+    `binary_template` loads them from a separate binary file, if the encoder
+    supports the `binary` output of `UnicodeDataCompressor`.
+    """
+
+    name = ""
+    template = ""
+    templates: Tuple[str, ...] = ()
+    binary_template = ""
+
+    def encode(self, entries: UnicodeDataEntries, value_bits: int) -> bytes:
+        raise NotImplementedError()
+
+    def decode(
+        self, data: bytes, value_bits: int, entry_count: Optional[int]
+    ) -> Tuple[Sequence[int], Sequence[int]]:
+        """Decodes the result of `encode()`, and returns the counts and the
+        values of the runs.
+
+        `entry_count` is the number of the runs, if the encoder needs it.
+        """
+        raise NotImplementedError()
+
+    def mapping(self, entries: UnicodeDataEntries, value_bits: int) -> Dict[str, str]:
+        """Returns additional variables for the `template`."""
+        return {}
+
+
+class UnicodeDataVarintEncoder(UnicodeDataEncoder):
+    """Encodes each run to a variable length integer of
+    `(count - 1) << value_bits | value`."""
+
+    name = "varint"
+    template = "template.js"
+    templates = (
+        "template-bsearch.js",
+        "template-2stage.js",
+        "template-multi.js",
+        "template-module.mjs",
+    )
+    binary_template = "template-module.mjs"
+
+    def encode(self, entries: UnicodeDataEntries, value_bits: int) -> bytes:
+        bytes = bytearray()
+        for entry in entries:
+            assert entry.count > 0
+            combined = ((entry.count - 1) << value_bits) | entry.value
+            bytes.extend(_to_varint(combined))
+        return bytes
+
+    def decode(
+        self, data: bytes, value_bits: int, entry_count: Optional[int]
+    ) -> Tuple[Sequence[int], Sequence[int]]:
+        combined, _ = _from_varints(data, entry_count)
+        mask = (1 << value_bits) - 1
+        counts = [(value >> value_bits) + 1 for value in combined]
+        values = [value & mask for value in combined]
+        return counts, values
+
+
+class UnicodeDataPackedEncoder(UnicodeDataEncoder):
+    """Encodes the number of bits for counts in a byte, followed by runs of
+    `count - 1` and `value` in fixed numbers of bits, packed in the most
+    significant bit first order."""
+
+    name = "packed"
+    template = "template-packed.js"
+
+    @staticmethod
+    def _count_bits(entries: UnicodeDataEntries) -> int:
+        return _bitsize_for(max(entry.count - 1 for entry in entries))
+
+    def encode(self, entries: UnicodeDataEntries, value_bits: int) -> bytes:
+        count_bits = self._count_bits(entries)
+        bits = count_bits + value_bits
+        packed = 0
+        for entry in entries:
+            packed = (packed << bits) | ((entry.count - 1) << value_bits) | entry.value
+        total_bits = bits * len(entries)
+        padding = -total_bits % 8
+        return bytes((count_bits,)) + (packed << padding).to_bytes(
+            (total_bits + padding) // 8, "big"
+        )
+
+    def decode(
+        self, data: bytes, value_bits: int, entry_count: Optional[int]
+    ) -> Tuple[Sequence[int], Sequence[int]]:
+        if entry_count is None:
+            raise ValueError("The packed encoder needs entry_count")
+        count_bits = data[0]
+        bits = count_bits + value_bits
+        data = data[1:]
+        # Convert to a string of "0" and "1" at once, and slice it.
+        text = format(int.from_bytes(data, "big"), "b").zfill(len(data) * 8)
+        counts = [
+            int(text[i : i + count_bits] or "0", 2) + 1
+            for i in range(0, bits * entry_count, bits)
+        ]
+        values = [
+            int(text[i : i + value_bits] or "0", 2)
+            for i in range(count_bits, bits * entry_count, bits)
+        ]
+        return counts, values
+
+    def mapping(self, entries: UnicodeDataEntries, value_bits: int) -> Dict[str, str]:
+        return {"COUNT_BITS": str(self._count_bits(entries))}
+
+
+class UnicodeDataColumnsEncoder(UnicodeDataEncoder):
+    """Encodes `count - 1` of all runs as variable length integers, followed by
+    values of all runs in fixed sizes.
+
+    Storing similar numbers together often makes the gzip size smaller.
+    """
+
+    name = "columns"
+    template = "template-columns.js"
+
+    def encode(self, entries: UnicodeDataEntries, value_bits: int) -> bytes:
+        bytes = bytearray()
+        for entry in entries:
+            bytes.extend(_to_varint(entry.count - 1))
+        bytes.extend(_to_fixed([entry.value for entry in entries], value_bits))
+        return bytes
+
+    def decode(
+        self, data: bytes, value_bits: int, entry_count: Optional[int]
+    ) -> Tuple[Sequence[int], Sequence[int]]:
+        if entry_count is None:
+            raise ValueError("The columns encoder needs entry_count")
+        counts, end = _from_varints(data, entry_count)
+        return [count + 1 for count in counts], _from_fixed(data[end:], value_bits)
+
+
+class UnicodeDataBlocksEncoder(UnicodeDataEncoder):
+    """Encodes a two-stage table as in `UnicodeDataEntries.compile()`; `stage1`
+    followed by `stage2`, each in fixed sizes.
+
+    The decoder needs no decoding, at the cost of larger sizes.
+    """
+
+    name = "blocks"
+    template = "template-blocks.js"
+
+    def __init__(self, shift: int = 7):
+        self.shift = shift
+
+    def _compile(self, entries: UnicodeDataEntries):
+        compiled = entries.compile(shift=self.shift)
+        # Code points after the last entry can have values not in `entries`,
+        # such as `None` for combined entries. They are out of `VALUES`.
+        values_for_int = entries.values_for_int()
+        assert compiled.values_for_int()[: len(values_for_int)] == values_for_int
+        return compiled
+
+    def encode(self, entries: UnicodeDataEntries, value_bits: int) -> bytes:
+        compiled = self._compile(entries)
+        stage1 = list(compiled._stage1)
+        return _to_fixed(stage1, _bitsize_for(max(stage1))) + _to_fixed(
+            list(compiled._stage2), value_bits
+        )
+
+    def decode(
+        self, data: bytes, value_bits: int, entry_count: Optional[int]
+    ) -> Tuple[Sequence[int], Sequence[int]]:
+        block_size = 1 << self.shift
+        stage1_length = (UnicodeDataEntry.max_code_point + 1) >> self.shift
+        value_size = array(_fixed_typecode(value_bits)).itemsize
+        # The size of `stage1` items is the smallest one for the number of
+        # blocks, as in `compile()`.
+        for stage1_bits in (8, 16, 32):
+            stage1_size = stage1_bits // 8
+            stage2_size = len(data) - stage1_length * stage1_size
+            block_count = stage2_size // (value_size * block_size)
+            if _bitsize_for(block_count - 1) <= stage1_bits:
+                break
+        stage1 = _from_fixed(data[: stage1_length * stage1_size], stage1_bits)
+        stage2 = _from_fixed(data[stage1_length * stage1_size :], value_bits)
+
+        # Compute runs of each block once, then concatenate them.
+        runs_for_block: Dict[int, List[List[int]]] = {}
+        counts: List[int] = []
+        values: List[int] = []
+        for block in stage1:
+            runs = runs_for_block.get(block)
+            if runs is None:
+                start = block * block_size
+                runs = runs_for_block[block] = [
+                    [len(list(group)), value]
+                    for value, group in itertools.groupby(
+                        stage2[start : start + block_size]
+                    )
+                ]
+            first = 0
+            if values and values[-1] == runs[0][1]:
+                counts[-1] += runs[0][0]
+                first = 1
+            for count, value in runs[first:]:
+                counts.append(count)
+                values.append(value)
+        return counts, values
+
+    def mapping(self, entries: UnicodeDataEntries, value_bits: int) -> Dict[str, str]:
+        stage1 = self._compile(entries)._stage1
+        return {
+            "BLOCK_SHIFT": str(self.shift),
+            "STAGE1_LENGTH": str(len(stage1)),
+            "STAGE1_ARRAY": UnicodeDataCompressor._typed_array_for(
+                _bitsize_for(max(stage1))
+            ),
+        }
+
+
+class UnicodeDataEncodedSize(NamedTuple):
+    encoder: str
+    raw: int
+    base64: int
+    gzip: int
+
+
 class UnicodeDataCompressor(object):
-    def __init__(self, entries: UnicodeDataEntries):
+    """Generates files from templates, with entries compressed into bytes.
+
+    Entries are stored as runs of values, encoded as variable length integers
+    and then in base64.
+    The "`js`" directory has templates that decode them in JavaScript:
+    * `template.js` walks the runs linearly. It is the smallest code, and the
+      fastest to initialize, but slow for code points near the end.
+    * `template-bsearch.js` finds the run by binary search.
+    * `template-2stage.js` builds a two-stage table of `1 << shift` code point
+      blocks. It is the fastest to look up, at a small initialization cost.
+
+    * `template-module.mjs` is an ES module that loads the bytes from a
+      separate binary file by `fetch`. See the `binary` argument of
+      `substitute_template()`.
+    * `template-multi.js` is for entries of multiple properties. It has
+      accessors of each property, and a lookup of all of them at once.
+
+    `entries` can be a list of entries of multiple properties. They are
+    combined by `combine()` into one set of runs, whose values are `tuple`s of
+    values of all properties. It is often smaller than compressing each
+    property separately, because boundaries of runs are shared. Only the
+    varint encoder is supported for them.
+
+    Other encodings are available by the `encoder` argument, which is a name
+    in `encoders`, or `"auto"` to choose the one with the smallest gzip size.
+    Each encoder has its template in the "`js`" directory.
+    `report()` returns sizes of all encoders, and `decompress()` creates
+    entries from the compressed bytes.
+    """
+
+    encoders: Dict[str, UnicodeDataEncoder] = {
+        encoder.name: encoder
+        for encoder in (
+            UnicodeDataVarintEncoder(),
+            UnicodeDataPackedEncoder(),
+            UnicodeDataColumnsEncoder(),
+            UnicodeDataBlocksEncoder(),
+        )
+    }
+
+    def __init__(
+        self,
+        entries: Union[UnicodeDataEntries, Sequence[UnicodeDataEntries]],
+        shift: int = 7,
+        encoder: str = "varint",
+    ):
+        if isinstance(entries, UnicodeDataEntries):
+            self._properties = [entries]
+        else:
+            # `template-multi.js` decodes only the varint encoder.
+            if encoder == "auto":
+                encoder = "varint"
+            if encoder != "varint":
+                raise ValueError(
+                    f"Multiple properties need the varint encoder, not {encoder}"
+                )
+            self._properties = list(entries)
+            entries = self.combine(self._properties)
         self._entries = entries
+        self.shift = shift
+        if encoder == "auto":
+            encoder = self.smallest_encoder()
+        self.encoder = UnicodeDataCompressor.encoders[encoder]
+
+    @staticmethod
+    def combine(properties: Sequence[UnicodeDataEntries]) -> UnicodeDataEntries:
+        """Combines entries of multiple properties into one.
+
+        The runs of the result are split at the boundaries of runs of all
+        `properties`, and their values are `tuple`s of the _integer values_ of
+        `properties`. Its `values_for_int()` is the list of distinct `tuple`s.
+
+        `properties` must have their missing values filled, and values mapped
+        to _integer values_. The result covers code points all of them have.
+        """
+        assert properties
+        for entries in properties:
+            assert entries.values_for_int() is not None
+            assert entries._is_contiguous()
+
+        def runs() -> Iterable[UnicodeDataEntry]:
+            iterators = [iter(entries) for entries in properties]
+            currents = [next(iterator, None) for iterator in iterators]
+            start = 0
+            while all(currents):
+                end = min(current.max for current in currents)
+                yield UnicodeDataEntry(
+                    start, end, tuple(current.value for current in currents)
+                )
+                start = end + 1
+                for i, current in enumerate(currents):
+                    if current.max == end:
+                        currents[i] = next(iterators[i], None)
+
+        combined = UnicodeDataEntries(
+            entries=list(UnicodeDataEntry.merge(runs())),
+            name="".join(entries.name or "" for entries in properties),
+        )
+        combined.map_values_to_int()
+        return combined
+
+    @staticmethod
+    def encoder_for_template(template: pathlib.Path) -> Optional[str]:
+        """Returns the name of the encoder whose data `template` decodes, or
+        `None` if `template` is not one of the templates of `encoders`."""
+        for encoder in UnicodeDataCompressor.encoders.values():
+            if template.name == encoder.template or template.name in encoder.templates:
+                return encoder.name
+        return None
+
+    @staticmethod
+    def register_encoder(encoder: UnicodeDataEncoder) -> None:
+        """Adds `encoder` to `encoders`."""
+        assert encoder.name and encoder.name != "auto"
+        UnicodeDataCompressor.encoders[encoder.name] = encoder
 
     @property
     def _bitsize(self) -> int:
@@ -34,51 +454,149 @@ class UnicodeDataCompressor(object):
 
     @staticmethod
     def _bitsize_for(value: int) -> int:
-        bits = 0
-        while value:
-            bits += 1
-            value >>= 1
-        return bits
+        return _bitsize_for(value)
+
+    @staticmethod
+    def _typed_array_for(bits: int) -> str:
+        if bits <= 8:
+            return "Uint8Array"
+        if bits <= 16:
+            return "Uint16Array"
+        return "Uint32Array"
+
+    @staticmethod
+    def _js_value(value: Any) -> str:
+        # Values of combined entries are arrays of the _integer values_ of
+        # the properties.
+        if isinstance(value, tuple):
+            return json.dumps(list(value), separators=(",", ":"))
+        return f'"{value}"'
+
+    @staticmethod
+    def _output_name(template: pathlib.Path, name: str) -> str:
+        # "template-bsearch.js" generates "LineBreak-bsearch.js".
+        stem = template.stem
+        variant = stem[len("template") :] if stem.startswith("template") else ""
+        return f"{name}{variant}{template.suffix}"
 
     @staticmethod
     def _to_bytes(value: int) -> bytearray:
-        bytes = bytearray()
-        while value >= 0x80:
-            bytes.append(value & 0x7F)
-            value >>= 7
-        bytes.append(value)
-        bytes.reverse()
-        for i in range(0, len(bytes) - 1):
-            bytes[i] |= 0x80
-        return bytes
+        return _to_varint(value)
 
-    def compress(self) -> bytearray:
+    def compress(self, encoder: Optional[str] = None) -> bytes:
+        """Returns the bytes encoded by `encoder`, or by `self.encoder`."""
         entries = self._entries
         assert entries._is_contiguous()
         value_bits = self._bitsize
-        bytes = bytearray()
         for entry in entries:
             assert isinstance(entry.value, int)
             assert entry.value < (1 << value_bits)
-            assert entry.count > 0
-            combined = ((entry.count - 1) << value_bits) | entry.value
-            _logger.debug(
-                "%04X %s=%d: %d -> %X",
-                entry.min,
-                entries.values_for_int()[entry.value],
-                entry.value,
-                entry.count,
-                combined,
+        return self._encoder(encoder).encode(entries, value_bits)
+
+    def _encoder(self, encoder: Optional[str]) -> UnicodeDataEncoder:
+        if encoder is None:
+            return self.encoder
+        return UnicodeDataCompressor.encoders[encoder]
+
+    def report(self) -> List[UnicodeDataEncodedSize]:
+        """Returns the raw, base64, and gzipped base64 sizes of all encoders."""
+        sizes = []
+        for name in UnicodeDataCompressor.encoders:
+            bytes = self.compress(name)
+            base64bytes = base64.b64encode(bytes)
+            sizes.append(
+                UnicodeDataEncodedSize(
+                    name,
+                    len(bytes),
+                    len(base64bytes),
+                    len(gzip.compress(base64bytes, mtime=0)),
+                )
             )
-            bytes.extend(self._to_bytes(combined))
-        return bytes
+        return sizes
+
+    @staticmethod
+    def decompress(
+        data: bytes,
+        values_for_int: List[Any],
+        encoder: str = "varint",
+        entry_count: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> UnicodeDataEntries:
+        """Creates entries from the result of `compress()`.
+
+        The entries have _integer values_ as in `map_values_to_int()`, and
+        `values_for_int` is their original values.
+        `entry_count` is the number of the entries. It is needed for some
+        encoders, such as `"packed"` and `"columns"`.
+        """
+        value_bits = _bitsize_for(len(values_for_int) - 1)
+        counts, values = UnicodeDataCompressor.encoders[encoder].decode(
+            data, value_bits, entry_count
+        )
+        ends = array("I", itertools.accumulate(counts))
+        mins = array("I", (0,)) + ends[:-1]
+        maxes = array("I", map((-1).__add__, ends))
+        entries = UnicodeDataEntries(entries=(), name=name)
+        entries._set_columns(
+            mins,
+            maxes,
+            array("I", values),
+            list(range(len(values_for_int))),
+        )
+        entries._values_for_int = list(values_for_int)
+        return entries
+
+    def smallest_encoder(self) -> str:
+        """Returns the name of the encoder with the smallest gzip size."""
+        return min(self.report(), key=lambda size: size.gzip).encoder
+
+    def _properties_mapping(self) -> Dict[str, str]:
+        # Variables for templates of multiple properties. `COMBOS` is the
+        # flattened list of the _integer values_ of properties for each
+        # _integer value_ of the combined entries.
+        properties = self._properties
+        if len(properties) == 1:
+            combos = [[value] for value in range(len(properties[0].values_for_int()))]
+        else:
+            combos = self._entries.values_for_int()
+        return {
+            "PROPERTY_NAMES": json.dumps([entries.name for entries in properties]),
+            "PROPERTY_VALUES": json.dumps(
+                [[str(v) for v in entries.values_for_int()] for entries in properties],
+                separators=(",", ":"),
+            ),
+            "COMBOS": json.dumps(
+                [value for combo in combos for value in combo], separators=(",", ":")
+            ),
+        }
+
+    @staticmethod
+    def _loads_binary(text: str) -> bool:
+        return re.search(r"\$\{?BINARY_FILE\b", text) is not None
 
     def substitute_template(
         self,
         template: pathlib.Path,
         output: Optional[pathlib.Path] = None,
         name: Optional[str] = None,
+        binary: bool = False,
     ) -> str:
+        """Generates a file from `template`, and saves it to `output` if given.
+
+        `output` can be a directory. The file name is then `_output_name()`.
+
+        If `binary` is true, the compressed bytes are saved to a separate
+        `<name>.bin` file next to the output, instead of `$BASE64BYTES` in the
+        template. `template-module.mjs` loads the file by `fetch`. This is
+        supported only by encoders that have `binary_template`, and is
+        required by templates that load the file.
+        """
+        encoder = self.encoder_for_template(template)
+        if encoder and encoder != self.encoder.name:
+            raise ValueError(
+                f"{template.name} decodes the {encoder} encoder,"
+                f" not {self.encoder.name}"
+            )
         entries = self._entries
         bytes = self.compress()
         base64bytes = base64.b64encode(bytes)
@@ -87,8 +605,9 @@ class UnicodeDataCompressor(object):
         name = name or entries.name
         assert name
         _logger.info(
-            "%s: Bytes=%d, Base64=%d, #values=%d (%d bits)",
+            "%s: Encoder=%s, Bytes=%d, Base64=%d, #values=%d (%d bits)",
             name,
+            self.encoder.name,
             len(bytes),
             len(base64bytes),
             len(values_for_int),
@@ -96,13 +615,35 @@ class UnicodeDataCompressor(object):
         )
         mapping = {
             "NAME": name,
-            "BASE64BYTES": base64bytes.decode("ascii"),
+            "BYTE_COUNT": str(len(bytes)),
+            "ENTRY_COUNT": str(len(entries)),
+            "SHIFT": str(self.shift),
+            "VALUE_ARRAY": self._typed_array_for(value_bits),
             "VALUE_BITS": str(value_bits),
             "VALUE_MASK": str((1 << value_bits) - 1),
-            "VALUE_LIST": ",".join(f'"{v}"' for v in values_for_int),
+            "VALUE_LIST": ",".join(self._js_value(v) for v in values_for_int),
         }
+        mapping.update(self.encoder.mapping(entries, value_bits))
+        mapping.update(self._properties_mapping())
+        if output and str(output) != "-" and output.is_dir():
+            output = output / self._output_name(template, name)
+        if binary:
+            if not self.encoder.binary_template:
+                raise ValueError(
+                    f"The {self.encoder.name} encoder does not support binary output"
+                )
+            if not output or str(output) == "-":
+                raise ValueError("The binary output needs an output file")
+            binary_path = output.parent / f"{name}.bin"
+            mapping["BINARY_FILE"] = binary_path.name
+        else:
+            mapping["BASE64BYTES"] = base64bytes.decode("ascii")
 
         text = template.read_text()
+        if binary != self._loads_binary(text):
+            if binary:
+                raise ValueError(f"{template.name} does not load a binary file")
+            raise ValueError(f"{template.name} loads a binary file, use binary")
         text = string.Template(text)
         text = text.substitute(mapping)
 
@@ -110,10 +651,14 @@ class UnicodeDataCompressor(object):
             if str(output) == "-":
                 sys.stdout.write(text)
             else:
-                if output.is_dir():
-                    output = output / f"{name}{template.suffix}"
                 output.write_text(text, newline="\n")
                 _logger.info("Saved to %s", output)
+                # Keep the binary file if unchanged, to keep it cached.
+                if binary and (
+                    not binary_path.exists() or binary_path.read_bytes() != bytes
+                ):
+                    binary_path.write_bytes(bytes)
+                    _logger.info("Saved to %s", binary_path)
 
         return text
 
@@ -1,19 +1,36 @@
+from array import array
+import bisect
+import copy
 import enum
 import itertools
 import logging
 import re
+import sys
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Union
 from typing import Tuple
 
+if TYPE_CHECKING:
+    from .compiled import UnicodeDataCompiledEntries
+
 _logger = logging.getLogger("UnicodeDataEntry")
 
+_column_separator = re.compile(r"\s*;\s*")
+
+
+def _intern(value: Any) -> Any:
+    # Share equal strings across entries, such as entries of different Unicode
+    # versions, so that their value tables do not keep duplicates.
+    return sys.intern(value) if type(value) is str else value
+
 
 def u_hex(value: int) -> str:
     return f"{value:04X}"
@@ -46,6 +63,50 @@ class EmojiType(enum.Flag):
     Extended_Pictographic = enum.auto()
 
 
+def _value_to_json(value: Any) -> Any:
+    """Converts a value to a JSON value, for files in cache directories that
+    must not run code when loaded, such as pickles do.
+
+    Raises `TypeError` if the value is not one of the known types.
+    """
+    if value is None or type(value) in (str, int, bool, float):
+        return value
+    if type(value) is list:
+        return [_value_to_json(v) for v in value]
+    if type(value) is tuple:
+        return {"tuple": [_value_to_json(v) for v in value]}
+    if isinstance(value, EmojiType):
+        return {"EmojiType": value.value}
+    if isinstance(value, BidiBrackets):
+        return {"BidiBrackets": [value.pair, value.type]}
+    raise TypeError(f"{type(value).__name__} is not supported")
+
+
+def _value_from_json(value: Any) -> Any:
+    """The reverse of `_value_to_json()`."""
+    if type(value) is list:
+        return [_value_from_json(v) for v in value]
+    if type(value) is dict:
+        ((type_name, v),) = value.items()
+        if type_name == "tuple":
+            return tuple(_value_from_json(item) for item in v)
+        if type_name == "EmojiType":
+            return EmojiType(v)
+        if type_name == "BidiBrackets":
+            return BidiBrackets(v[0], v[1])
+        raise ValueError(f"Unknown type {type_name}")
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    """Returns a hashable key for a value. `list` values, such as values of
+    `ScriptExtensions`, are converted to `tuple`s.
+    """
+    if type(value) is list:
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
 class UnicodeDataEntry(object):
     """Represents a line in a [Unicode character database] file.
 
@@ -56,6 +117,8 @@ class UnicodeDataEntry(object):
     [Unicode character database]: https://unicode.org/reports/tr44/
     """
 
+    __slots__ = ("min", "max", "value")
+
     max_code_point = 0x10FFFF
 
     def __init__(self, min: int, max: int, value):
@@ -110,37 +173,39 @@ class UnicodeDataEntry(object):
 
     @staticmethod
     def from_lines(lines: Iterable[str], converter=None, comment=None):
+        """Parses lines of a [Unicode character database] file.
+
+        `comment` is called only for lines that are entirely comments, such as
+        the `@missing` lines. Comments after data are skipped.
+
+        [Unicode character database]: https://unicode.org/reports/tr44/
+        """
         for line in lines:
-            # Skip comments.
-            line = line.rstrip()
-            match = re.search(r"\s*#\s*(.*)", line)
-            if match:
-                start_index = match.start()
-                if comment:
-                    comment(match.group(1), start_index)
-                line = line[0:start_index]
+            # Skip comments. Most lines are either comment lines or have
+            # comments after data, so `partition` them without regex.
+            line, sep, line_comment = line.partition("#")
+            line = line.strip()
             if not line:
+                if sep and comment:
+                    comment(line_comment.strip(), 0)
                 continue
 
             # Data columns are separated by ';'.
-            columns = re.split(r"\s*;\s*", line)
-            assert len(columns) >= 2
-            value = columns[1] if len(columns) == 2 else columns[1:]
+            code, sep, value = line.partition(";")
+            if not sep:
+                raise ValueError(f"No values in {line!r}")
+            if ";" in value:
+                value = _column_separator.split(value.strip())
+            else:
+                value = value.strip()
             if converter:
                 value = converter(value)
 
-            # `columns[0]` is a code point or a range of code points.
-            code = columns[0]
-            codeRange = code.split("..")
-            if len(codeRange) == 1:
-                code = int(code, 16)
-                yield UnicodeDataEntry(code, code, value)
-            elif len(codeRange) == 2:
-                min = int(codeRange[0], 16)
-                max = int(codeRange[1], 16)
-                yield UnicodeDataEntry(min, max, value)
-            else:
-                assert False
+            # `code` is a code point or a range of code points.
+            min, sep, max = code.partition("..")
+            min = int(min, 16)
+            max = int(max, 16) if sep else min
+            yield UnicodeDataEntry(min, max, value)
 
     @staticmethod
     def from_pairs(values: Iterable[Tuple[int, Any]]):
@@ -174,14 +239,46 @@ class UnicodeDataEntry(object):
             yield from itertools.repeat(entry.value, entry.count)
             next = entry.max + 1
 
+    @staticmethod
+    def merge(entries: Iterable["UnicodeDataEntry"]) -> Iterable["UnicodeDataEntry"]:
+        """Merges adjacent entries with the same value, and removes entries
+        whose values are `None`.
+
+        Entries must be sorted and distinct.
+        """
+        last = None
+        for entry in entries:
+            if entry.value is None:
+                continue
+            if last is not None:
+                if last.max + 1 == entry.min and last.value == entry.value:
+                    last = UnicodeDataEntry(last.min, entry.max, last.value)
+                    continue
+                yield last
+            last = entry
+        if last is not None:
+            yield last
+
 
 class UnicodeDataEntries(object):
     """Represents a [Unicode character database] file,
     or a list of `UnicodeDataEntry`.
+
+    Entries are stored in columns; `array`s of `min` and `max`, and an `array`
+    of indices to a table of distinct values. `UnicodeDataEntry` instances are
+    created only when iterated.
+
     [Unicode character database]: https://unicode.org/reports/tr44/
     """
 
-    _entries: Sequence[UnicodeDataEntry]
+    # Increment when the result of parsing changes, to invalidate the parsed
+    # cache of `UnicodeDataCachedReader`.
+    parser_version = 1
+
+    _mins: array
+    _maxes: array
+    _value_indices: array
+    _values: List[Any]
 
     def __init__(
         self,
@@ -193,13 +290,14 @@ class UnicodeDataEntries(object):
         converter=None,
     ):
         self._missing_entries = self._default_missing_entries()
+        self._missing_index = None  # type: Optional[UnicodeDataEntries]
         self.name = name
         self._values_for_int = None  # type: list
 
         if entries is not None:
             assert lines is None
             assert converter is None
-            self._entries = entries  # type: ignore
+            self._set_entries(entries)
         else:
             assert lines is not None
             self._load_lines(lines, converter=converter)
@@ -207,9 +305,40 @@ class UnicodeDataEntries(object):
     def _default_missing_entries(self) -> List[UnicodeDataEntry]:
         return []
 
+    def copy(self) -> "UnicodeDataEntries":
+        """Returns a copy that can be modified without affecting this entries."""
+        self._ensure_columns()
+        # Columns are never modified in place, so they can be shared.
+        entries = copy.copy(self)
+        entries._missing_entries = list(self._missing_entries)
+        if self._values_for_int is not None:
+            entries._values_for_int = list(self._values_for_int)
+        return entries
+
+    def _set_entries(self, entries: Iterable[UnicodeDataEntry]) -> None:
+        # Columns are created lazily by `_ensure_columns()`, so that loading
+        # and parsing run only when the entries are used.
+        self._pending_entries = entries
+
+    def _set_columns(
+        self,
+        mins: array,
+        maxes: array,
+        value_indices: array,
+        values: List[Any],
+    ) -> None:
+        assert len(mins) == len(maxes) == len(value_indices)
+        self._pending_entries = None
+        self._mins = mins
+        self._maxes = maxes
+        self._value_indices = value_indices
+        self._values = values
+
     def _load_lines(self, lines: Iterable[str], converter=None):
-        self._entries = UnicodeDataEntry.from_lines(
-            lines, converter=converter, comment=self._load_comment
+        self._set_entries(
+            UnicodeDataEntry.from_lines(
+                lines, converter=converter, comment=self._load_comment
+            )
         )
 
     def _load_comment(self, comment: str, start_index: int):
@@ -219,70 +348,253 @@ class UnicodeDataEntries(object):
             self._missing_entries.extend(entries)
             assert self._missing_entries
 
-    def _ensure_multi_iterable(self) -> None:
-        if not isinstance(self._entries, (list, tuple)):
-            self._entries = tuple(self._entries)
-
-    def __iter__(self):
-        self._ensure_multi_iterable()
-        return self._entries.__iter__()
+    def _ensure_columns(self) -> None:
+        entries = self._pending_entries
+        if entries is None:
+            return
+        mins = array("I")
+        maxes = array("I")
+        value_indices = array("I")
+        values: List[Any] = []
+        index_for_value: Dict[Any, int] = {}
+        for entry in entries:
+            mins.append(entry.min)
+            maxes.append(entry.max)
+            value = entry.value
+            try:
+                index = index_for_value.get(value)
+                if index is None:
+                    index = index_for_value[value] = len(values)
+                    values.append(_intern(value))
+            except TypeError:
+                # Values such as `list` are not hashable and not deduplicated.
+                index = len(values)
+                values.append(value)
+            value_indices.append(index)
+        self._set_columns(mins, maxes, value_indices, values)
+        # `_missing_entries` may have been added while parsing `entries`.
+        self._missing_index = None
+
+    def __iter__(self) -> Iterator[UnicodeDataEntry]:
+        self._ensure_columns()
+        values = self._values
+        return map(
+            UnicodeDataEntry,
+            self._mins,
+            self._maxes,
+            (values[i] for i in self._value_indices),
+        )
 
     def __len__(self):
-        self._ensure_multi_iterable()
-        return len(self._entries)
+        self._ensure_columns()
+        return len(self._mins)
 
     def __getitem__(self, code: int) -> Any:
         return self.value(code)
 
     def missing_value(self, code: int):
-        if self._missing_entries:
-            # `_missing_entries` can overlap, iterate all entries.
-            for entry in self._missing_entries:
-                if entry.is_in_range(code):
-                    return entry.value
-        return None
+        if not self._missing_entries:
+            return None
+        return self.missing_entries().value(code)
+
+    def missing_entries(self) -> "UnicodeDataEntries":
+        """Returns the entries of missing values.
+
+        The `@missing` lines and other default values in a file can overlap.
+        They are resolved to sorted and distinct entries once, where the first
+        one in the file wins, so that `missing_value()` is `O(log n)`.
+        """
+        self._ensure_columns()
+        if self._missing_index is None:
+            self._missing_index = UnicodeDataEntries(
+                entries=self._resolve_missing_entries(self._missing_entries),
+                name=self.name,
+            )
+            self._missing_index._ensure_columns()
+        return self._missing_index
 
     def _is_contiguous(self):
-        self._ensure_multi_iterable()
-        entries = self._entries
-        return all(
-            entries[i].max + 1 == entries[i + 1].min for i in range(len(entries) - 1)
-        )
+        self._ensure_columns()
+        mins = self._mins
+        maxes = self._maxes
+        return all(maxes[i] + 1 == mins[i + 1] for i in range(len(mins) - 1))
 
     def _is_distinct(self):
-        self._ensure_multi_iterable()
-        entries = self._entries
-        return all(entries[i].max < entries[i + 1].min for i in range(len(entries) - 1))
+        self._ensure_columns()
+        mins = self._mins
+        maxes = self._maxes
+        return all(maxes[i] < mins[i + 1] for i in range(len(mins) - 1))
 
     def _is_sorted(self):
-        self._ensure_multi_iterable()
-        entries = self._entries
-        return all(
-            entries[i].min <= entries[i + 1].min for i in range(len(entries) - 1)
-        )
+        self._ensure_columns()
+        mins = self._mins
+        return all(mins[i] <= mins[i + 1] for i in range(len(mins) - 1))
 
     def sort(self):
-        self._entries = sorted(self._entries, key=lambda e: e.min)
+        self._ensure_columns()
+        order = sorted(range(len(self._mins)), key=self._mins.__getitem__)
+        self._set_columns(
+            array("I", (self._mins[i] for i in order)),
+            array("I", (self._maxes[i] for i in order)),
+            array("I", (self._value_indices[i] for i in order)),
+            self._values,
+        )
+
+    @staticmethod
+    def _resolve_missing_entries(
+        missing_entries: Sequence[UnicodeDataEntry],
+    ) -> List[UnicodeDataEntry]:
+        bounds = sorted(
+            set(e.min for e in missing_entries)
+            | set(e.max + 1 for e in missing_entries)
+        )
+        resolved: List[UnicodeDataEntry] = []
+        for min, next in zip(bounds, bounds[1:]):
+            # No entries start or end within `min` and `next`, so an entry
+            # either covers all of them or none of them.
+            for entry in missing_entries:
+                if entry.min <= min and entry.max >= min:
+                    value = entry.value
+                    break
+            else:
+                continue
+            last = resolved[-1] if resolved else None
+            if last and last.max + 1 == min and last.value == value:
+                last.max = next - 1
+            else:
+                resolved.append(UnicodeDataEntry(min, next - 1, value))
+        return resolved
+
+    def _missing_entries_for_ranges(self) -> Optional["UnicodeDataEntries"]:
+        """Returns `missing_entries()`, or `None` if `missing_value()` is
+        overridden and thus missing values are computed for each code point."""
+        if type(self).missing_value is not UnicodeDataEntries.missing_value:
+            return None
+        return self.missing_entries()
+
+    def _missing_entries_in(
+        self,
+        first: int,
+        last: int,
+        missing_entries: Optional["UnicodeDataEntries"],
+    ) -> Iterable[UnicodeDataEntry]:
+        """Returns entries of missing values from `first` to `last`, inclusive.
+
+        The returned entries cover all code points in the range. Their values
+        can be `None` if there are no missing values.
+        """
+        if missing_entries is None:
+            code = first
+            for value, group in itertools.groupby(
+                range(first, last + 1), key=self.missing_value
+            ):
+                count = sum(1 for _ in group)
+                yield UnicodeDataEntry(code, code + count - 1, value)
+                code += count
+            return
+
+        mins = missing_entries._mins
+        maxes = missing_entries._maxes
+        value_indices = missing_entries._value_indices
+        values = missing_entries._values
+        code = first
+        for i in range(bisect.bisect_left(maxes, first), len(maxes)):
+            min = mins[i]
+            if min > last:
+                break
+            if min > code:
+                yield UnicodeDataEntry(code, min - 1, None)
+                code = min
+            max = maxes[i] if maxes[i] < last else last
+            yield UnicodeDataEntry(code, max, values[value_indices[i]])
+            code = max + 1
+        if code <= last:
+            yield UnicodeDataEntry(code, last, None)
+
+    def _with_missing_entries(
+        self,
+        entries: Iterable[UnicodeDataEntry],
+        missing_entries: Optional["UnicodeDataEntries"],
+    ) -> Iterable[UnicodeDataEntry]:
+        next = 0
+        for entry in entries:
+            if entry.min > next:
+                yield from self._missing_entries_in(
+                    next, entry.min - 1, missing_entries
+                )
+            yield entry
+            next = entry.max + 1
 
     def fill_missing_values(self):
-        values = UnicodeDataEntry.values_for_code(self._entries, self.missing_value)
-        self._entries = UnicodeDataEntry.from_values(values)
+        # Gaps are filled by ranges of missing values, unless `missing_value()`
+        # is overridden.
+        entries = self._with_missing_entries(
+            iter(self), self._missing_entries_for_ranges()
+        )
+        self._set_entries(UnicodeDataEntry.merge(entries))
 
     def unicodes(self) -> Iterable[int]:
         """Returns a list of Unicode code points defined in this entries."""
-        self._ensure_multi_iterable()
-        return itertools.chain(*(e.range() for e in self._entries))
+        self._ensure_columns()
+        return itertools.chain(
+            *(range(min, max + 1) for min, max in zip(self._mins, self._maxes))
+        )
 
     def value(self, code: int) -> Any:
-        """Returns the value for the given code point."""
-        self._ensure_multi_iterable()
-        for entry in self._entries:
-            if code < entry.min:
-                return self.missing_value(code)
-            if code <= entry.max:
-                return entry.value
+        """Returns the value for the given code point.
+
+        Entries must be sorted and distinct. The lookup is `O(log n)`.
+        """
+        self._ensure_columns()
+        maxes = self._maxes
+        i = bisect.bisect_left(maxes, code)
+        if i < len(maxes) and code >= self._mins[i]:
+            return self._values[self._value_indices[i]]
         return self.missing_value(code)
 
+    def values(self, codes: Iterable[int]) -> List[Any]:
+        """Returns a list of values for the given code points.
+
+        This is faster than calling `value()` for each code point. When `codes`
+        are in ascending order, entries are walked by a cursor instead of
+        searched from the start for each code point.
+        """
+        self._ensure_columns()
+        mins = self._mins
+        maxes = self._maxes
+        value_indices = self._value_indices
+        values = self._values
+        missing_value = self.missing_value
+        count = len(maxes)
+        result = []
+        append = result.append
+        # `i` is the result of the search for `last_code`, so it is the lower
+        # bound of the search for code points not less than `last_code`. It
+        # is not updated by the cache of `min` to `max`, which may be an entry
+        # before `i`.
+        i = 0
+        last_code = -1
+        min = max = -1
+        value = None
+        for code in codes:
+            if min <= code <= max:
+                append(value)
+                continue
+            i = bisect.bisect_left(maxes, code, i if code >= last_code else 0)
+            last_code = code
+            if i < count and code >= mins[i]:
+                min = mins[i]
+                max = maxes[i]
+                value = values[value_indices[i]]
+                append(value)
+            else:
+                append(missing_value(code))
+        return result
+
+    def values_for_str(self, text: str) -> List[Any]:
+        """Returns a list of values for each character in the string."""
+        return self.values(map(ord, text))
+
     def filter(self, pred: Callable[[Any], bool]) -> Iterable[UnicodeDataEntry]:
         """Returns an `Iterable` of `UnicodeDataEntry` for the given `pred`."""
         return (entry for entry in self if pred(entry.value))
@@ -309,8 +621,7 @@ class UnicodeDataEntries(object):
         The list includes missing values,
         so that `tuple(values_for_code())[code]` is equal to `value(code)`.
         """
-        self._ensure_multi_iterable()
-        return UnicodeDataEntry.values_for_code(self._entries, self.missing_value)
+        return UnicodeDataEntry.values_for_code(self, self.missing_value)
 
     def values_for_int(self):
         """Returns a list of values whose index is the _integer value_.
@@ -330,28 +641,56 @@ class UnicodeDataEntries(object):
         Note that missing values are computed that they will not be mapped. To
         map them, `fill_missing_values()` to fill entries for missing values.
 
+        Equal `list` values are mapped to the same integer value.
+
         On return, the original values are stored in `self.value_list`.
         """
         assert self._values_for_int is None
-        self._ensure_multi_iterable()
+        self._ensure_columns()
+        # Integer values are assigned in the order of entries, not in the order
+        # of the value table, so that they don't change by how entries are
+        # created.
+        values = self._values
         value_map = {}
-        for entry in self._entries:
-            assert not isinstance(entry.value, int)
-            entry.value = value_map.setdefault(entry.value, len(value_map))
-
-        value_count = len(value_map)
-        value_list = [None] * value_count
-        for value, index in value_map.items():
-            assert index < value_count
-            assert value_list[index] is None
-            value_list[index] = value
+        value_list = []
+        int_for_index = {}
+        for index in self._value_indices:
+            if index not in int_for_index:
+                value = values[index]
+                assert not isinstance(value, int)
+                key = _hashable(value)
+                int_value = value_map.get(key)
+                if int_value is None:
+                    int_value = value_map[key] = len(value_list)
+                    value_list.append(value)
+                int_for_index[index] = int_value
+
+        value_count = len(value_list)
+        self._set_columns(
+            self._mins,
+            self._maxes,
+            array("I", (int_for_index[i] for i in self._value_indices)),
+            list(range(value_count)),
+        )
         self._values_for_int = value_list
 
+    def compile(self, shift: int = 7) -> "UnicodeDataCompiledEntries":
+        """Returns a two-stage lookup table of this entries.
+
+        The table covers all Unicode code points, with missing values filled
+        as in `fill_missing_values()`, and values mapped to _integer values_ as
+        in `map_values_to_int()`. This entries is not changed.
+
+        The lookup is `O(1)`, and a table is usually a few tens of KB.
+        """
+        from .compiled import UnicodeDataCompiledEntries
+
+        return UnicodeDataCompiledEntries.from_entries(self, shift=shift)
+
     def to_dict(self) -> Dict[int, Any]:
         """Returns a `dict` of values with a Unicode code point as the key."""
-        self._ensure_multi_iterable()
         dict = {}
-        for entry in self._entries:
+        for entry in self:
             for code in entry.range():
                 dict[code] = entry.value
         return dict
@@ -364,27 +703,56 @@ class UnicodeBidiBracketsDataEntries(UnicodeDataEntries):
 
 
 class UnicodeEmojiDataEntries(UnicodeDataEntries):
+    def _default_missing_entries(self) -> List[UnicodeDataEntry]:
+        return [UnicodeDataEntry(0, UnicodeDataEntry.max_code_point, EmojiType(0))]
+
     def _load_lines(self, lines: Iterable[str], converter=None):
         converter = converter or (lambda v: EmojiType[v])
-        super()._load_lines(lines, converter=converter)
+        entries = UnicodeDataEntry.from_lines(
+            lines, converter=converter, comment=self._load_comment
+        )
+        self._set_entries(self._unite_flags(entries))
 
+    @staticmethod
+    def _unite_flags(
+        entries: Iterable[UnicodeDataEntry],
+    ) -> Iterable[UnicodeDataEntry]:
         # `emoji-data.txt` has multiple Emoji properties as separate lists.
-        # Unite them to `EmojiType` flags.
-        dict = {}
-        for entry in self._entries:
-            for code in entry.range():
-                value = dict.get(code, EmojiType(0))
-                dict[code] = value | entry.value
-        items = sorted(dict.items(), key=lambda i: i[0])
-        self._entries = UnicodeDataEntry.from_pairs(items)
+        # Unite them to `EmojiType` flags by sweeping the starts and the ends
+        # of ranges in the code point order.
+        events = []
+        for entry in entries:
+            events.append((entry.min, 1, entry.value))
+            events.append((entry.max + 1, -1, entry.value))
+        events.sort(key=lambda e: e[0])
+        counts: Dict[EmojiType, int] = {}
+        value = EmojiType(0)
+        min = 0
+        for code, group in itertools.groupby(events, key=lambda e: e[0]):
+            for _, delta, flag in group:
+                counts[flag] = counts.get(flag, 0) + delta
+            new_value = EmojiType(0)
+            for flag, count in counts.items():
+                if count > 0:
+                    new_value |= flag
+            if new_value == value:
+                continue
+            if value:
+                yield UnicodeDataEntry(min, code - 1, value)
+            value = new_value
+            min = code
 
     def _load_comment(self, comment: str, start_index: int):
         # Ignore the special `@missing` line in `emoji-data.txt`:
         # @missing: 0000..10FFFF  ; Emoji ; No
         pass
 
-    def missing_value(self, code: int):
-        return EmojiType(0)
+
+class UnicodeGeneralCategoryDataEntries(UnicodeDataEntries):
+    def _load_lines(self, lines: Iterable[str], converter=None):
+        super()._load_lines(lines, converter=converter)
+        # `extracted/DerivedGeneralCategory` is not sorted.
+        self.sort()
 
 
 class UnicodeLineBreakDataEntries(UnicodeDataEntries):
@@ -0,0 +1,285 @@
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import logging
+import pathlib
+import pickle
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from .compressor import UnicodeDataCompressor
+from .entry import UnicodeDataEntries
+from .reader import UnicodeDataCachedReader
+from .reader import UnicodeDataReader
+from .snapshot import _properties
+
+_logger = logging.getLogger("UnicodeDataGenerator")
+
+# The file in output directories that has the hashes of generated files.
+_hashes_name = ".generate.json"
+
+
+class _Job(NamedTuple):
+    entries: UnicodeDataEntries
+    template: pathlib.Path
+    output: pathlib.Path
+    encoder: str
+    binary: bool
+
+
+def _run_job(job: _Job) -> pathlib.Path:
+    compressor = UnicodeDataCompressor(job.entries, encoder=job.encoder)
+    compressor.substitute_template(
+        job.template, output=job.output, name=job.entries.name, binary=job.binary
+    )
+    return job.output
+
+
+class UnicodeDataGenerator(object):
+    """Generates files from templates for multiple properties at once.
+
+    Each property is read and prepared once, and shared by all templates.
+    Files are generated in a process pool, and files whose entries, templates,
+    and options are unchanged since the last run are skipped.
+    ```sh
+    unicodedata-reader generate line_break general_category \\
+      -t js/template.js js/template-bsearch.js
+    ```
+    The hashes of generated files are saved in "`.generate.json`" in the
+    output directory. They don't include this package, so use `force` to
+    regenerate files after changing the encoders.
+
+    Each template uses the encoder it decodes. `encoder` is for templates
+    not in `UnicodeDataCompressor.encoders`, and it is an error if it is not
+    the encoder of a template.
+
+    Templates that load binary files, such as `template-module.mjs`, need
+    `binary`. They load `<name>.bin` in the output directory. The binary file
+    is written once for each property, only if it changed.
+    """
+
+    def __init__(
+        self,
+        reader: Optional[UnicodeDataReader] = None,
+        encoder: Optional[str] = None,
+        binary: bool = False,
+        max_workers: Optional[int] = None,
+        force: bool = False,
+    ):
+        self._reader = reader or UnicodeDataReader.default
+        self.encoder = encoder
+        self.binary = binary
+        self.max_workers = max_workers
+        self.force = force
+
+    @staticmethod
+    def _prepare(entries: UnicodeDataEntries) -> UnicodeDataEntries:
+        if not entries._is_sorted():
+            entries.sort()
+        entries.fill_missing_values()
+        entries.map_values_to_int()
+        return entries
+
+    def _encoder_for(self, template: pathlib.Path) -> str:
+        encoder = UnicodeDataCompressor.encoder_for_template(template)
+        if encoder is None:
+            return self.encoder or "varint"
+        if self.encoder and self.encoder != encoder:
+            raise ValueError(
+                f"{template.name} decodes the {encoder} encoder, not {self.encoder}"
+            )
+        return encoder
+
+    @staticmethod
+    def _loads_binary(template: pathlib.Path) -> bool:
+        return UnicodeDataCompressor._loads_binary(template.read_text())
+
+    @staticmethod
+    def _hash(
+        entries: UnicodeDataEntries, template: pathlib.Path, encoder: str, binary: bool
+    ) -> str:
+        hash = hashlib.sha256()
+        hash.update(
+            pickle.dumps(
+                (
+                    encoder,
+                    binary,
+                    entries.name,
+                    [(entry.min, entry.max, entry.value) for entry in entries],
+                    entries.values_for_int(),
+                ),
+                protocol=4,
+            )
+        )
+        hash.update(template.read_bytes())
+        return hash.hexdigest()
+
+    def generate(
+        self,
+        properties: Iterable[str],
+        templates: Iterable[pathlib.Path],
+        output: Optional[pathlib.Path] = None,
+    ) -> List[pathlib.Path]:
+        """Generates files from `templates` for `properties`, the names of the
+        methods of the reader such as `"line_break"`.
+
+        Files are saved in `output`, or in the directory of each template if
+        omitted. Returns the paths of the generated files, excluding skipped
+        ones.
+        """
+        templates = list(templates)
+        entries_list = [
+            self._prepare(entries)
+            for entries in self._reader.load_many(properties).values()
+        ]
+
+        # Check all templates before generating any files.
+        encoders = [self._encoder_for(template) for template in templates]
+        binaries = [self._loads_binary(template) for template in templates]
+        for template, encoder, binary in zip(templates, encoders, binaries):
+            if binary and not self.binary:
+                raise ValueError(f"{template.name} loads a binary file, use binary")
+            if binary and not UnicodeDataCompressor.encoders[encoder].binary_template:
+                raise ValueError(
+                    f"{template.name}: The {encoder} encoder does not support"
+                    " binary output"
+                )
+
+        hashes_for_dir: Dict[pathlib.Path, Dict[str, str]] = {}
+        binary_dirs = set()
+        jobs: List[_Job] = []
+        job_hashes: List[str] = []
+        for template, encoder, binary in zip(templates, encoders, binaries):
+            output_dir = output if output else template.parent
+            hashes = hashes_for_dir.get(output_dir)
+            if hashes is None:
+                hashes = hashes_for_dir[output_dir] = self._load_hashes(output_dir)
+            if binary and output_dir not in binary_dirs:
+                binary_dirs.add(output_dir)
+                for entries in entries_list:
+                    self._write_binary(entries, encoder, output_dir)
+            for entries in entries_list:
+                assert entries.name
+                path = output_dir / UnicodeDataCompressor._output_name(
+                    template, entries.name
+                )
+                hash = self._hash(entries, template, encoder, binary)
+                if not self.force and path.exists() and hashes.get(path.name) == hash:
+                    _logger.info("Skipped %s, unchanged", path)
+                    continue
+                jobs.append(_Job(entries, template, path, encoder, binary))
+                job_hashes.append(hash)
+
+        paths = self._run_jobs(jobs)
+        for job, hash in zip(jobs, job_hashes):
+            hashes_for_dir[job.output.parent][job.output.name] = hash
+        for output_dir, hashes in hashes_for_dir.items():
+            self._save_hashes(output_dir, hashes)
+        return paths
+
+    @staticmethod
+    def _write_binary(
+        entries: UnicodeDataEntries, encoder: str, output_dir: pathlib.Path
+    ) -> None:
+        # Write binary files before the jobs, so that jobs of templates for
+        # the same property don't write the same file. Jobs write it only if
+        # it changed, which doesn't happen after this.
+        path = output_dir / f"{entries.name}.bin"
+        data = UnicodeDataCompressor(entries, encoder=encoder).compress()
+        if path.exists() and path.read_bytes() == data:
+            _logger.debug("Skipped %s, unchanged", path)
+            return
+        path.write_bytes(data)
+        _logger.info("Saved to %s", path)
+
+    def _run_jobs(self, jobs: List[_Job]) -> List[pathlib.Path]:
+        if len(jobs) <= 1 or self.max_workers == 1:
+            return [_run_job(job) for job in jobs]
+        with concurrent.futures.ProcessPoolExecutor(self.max_workers) as executor:
+            return list(executor.map(_run_job, jobs))
+
+    @staticmethod
+    def _load_hashes(output_dir: pathlib.Path) -> Dict[str, str]:
+        try:
+            return json.loads((output_dir / _hashes_name).read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_hashes(output_dir: pathlib.Path, hashes: Dict[str, str]) -> None:
+        text = json.dumps(hashes, indent=2, sort_keys=True) + "\n"
+        (output_dir / _hashes_name).write_text(text, newline="\n")
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "properties",
+        nargs="+",
+        choices=_properties,
+        metavar="property",
+        help=f"the properties to generate; {', '.join(_properties)}",
+    )
+    parser.add_argument(
+        "-t",
+        "--template",
+        type=pathlib.Path,
+        nargs="+",
+        required=True,
+        help="the templates to generate files from",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="the output directory (the directory of the template)",
+    )
+    parser.add_argument(
+        "-e",
+        "--encoder",
+        choices=tuple(UnicodeDataCompressor.encoders),
+        help="the encoder for templates of unknown encoders (varint)",
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="save the data to separate .bin files, for templates that load them",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="the number of processes (the number of CPUs)"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="generate files even if unchanged"
+    )
+    parser.add_argument("-f", "--clear-cache", action="store_true")
+    parser.add_argument(
+        "--ucd-version", help="the Unicode version such as 15.0.0 (latest)"
+    )
+    parser.add_argument(
+        "-v", "--verbose", help="increase output verbosity", action="count", default=0
+    )
+    parsed = parser.parse_args(args)
+    logging.basicConfig(level=logging.DEBUG if parsed.verbose else logging.INFO)
+
+    if parsed.clear_cache:
+        UnicodeDataCachedReader.clear_cache()
+    if parsed.ucd_version:
+        reader = UnicodeDataCachedReader(UnicodeDataReader(version=parsed.ucd_version))
+    else:
+        reader = UnicodeDataReader.default
+    generator = UnicodeDataGenerator(
+        reader,
+        encoder=parsed.encoder,
+        binary=parsed.binary,
+        max_workers=parsed.jobs,
+        force=parsed.force,
+    )
+    generator.generate(parsed.properties, parsed.template, output=parsed.output)
+
+
+if __name__ == "__main__":
+    main()
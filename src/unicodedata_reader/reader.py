@@ -1,22 +1,182 @@
+from array import array
+import collections
+import contextlib
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Dict
 from typing import Iterable
 from typing import Optional
-import shutil
-import urllib.request
-
+from typing import Type
+from typing import TypeVar
+from typing import Union
+import struct
+import sys
+import threading
+
+from unicodedata_reader.compiled import UnicodeDataCompiledEntries
 from unicodedata_reader.entry import *
+from unicodedata_reader.entry import _intern
+from unicodedata_reader.entry import _value_from_json
+from unicodedata_reader.entry import _value_to_json
+
+# Modules such as `http.client` and `urllib.request` are imported when they are
+# needed, to make importing this module fast.
+if TYPE_CHECKING:
+    import http.client
+    import urllib.parse
 
 _logger = logging.getLogger("UnicodeDataReader")
 
+_T = TypeVar("_T")
+
+
+def _map_concurrently(
+    func: Callable[[str], _T], names: Iterable[str], max_workers: Optional[int]
+) -> Dict[str, _T]:
+    import concurrent.futures
+
+    names = list(dict.fromkeys(names))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(func, names)
+        return dict(zip(names, results))
+
+
+@contextlib.contextmanager
+def _lock_file(path: Path):
+    """Locks `path` exclusively among threads and processes."""
+    lock = path.with_name(f".{path.name}.lock")
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    with lock.open("a+b") as file:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    # `LK_LOCK` retries for 10 seconds before raising.
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    # Write to a temporary file and rename it, so that other threads and
+    # processes never see a partially written file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp.write_bytes(data)
+        os.replace(temp, path)
+    finally:
+        if temp.exists():
+            temp.unlink()
+
+
+# The header of the parsed cache; the magic, and the length of the JSON of the
+# key, the name, the value table, and missing entries. Then the columns follow
+# in little endian, aligned to 4 bytes.
+_entries_cache_header = struct.Struct("<4sI")
+_entries_cache_magic = b"UCDE"
+_entries_cache_format_version = 2
+
+
+def _entries_to_bytes(entries: UnicodeDataEntries, key: list) -> bytes:
+    entries._ensure_columns()
+    columns = [
+        array("I", column)
+        for column in (entries._mins, entries._maxes, entries._value_indices)
+    ]
+    metadata = json.dumps(
+        {
+            "key": key,
+            "name": entries.name,
+            "values": [_value_to_json(value) for value in entries._values],
+            "missing": [
+                [entry.min, entry.max, _value_to_json(entry.value)]
+                for entry in entries._missing_entries
+            ],
+            "count": len(columns[0]),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    metadata += b" " * (-(_entries_cache_header.size + len(metadata)) % 4)
+    if sys.byteorder != "little":
+        for column in columns:
+            column.byteswap()
+    return b"".join(
+        (
+            _entries_cache_header.pack(_entries_cache_magic, len(metadata)),
+            metadata,
+            *(column.tobytes() for column in columns),
+        )
+    )
+
+
+def _entries_from_bytes(
+    entries_class: Type[UnicodeDataEntries], data: bytes, key: list
+) -> Optional[UnicodeDataEntries]:
+    magic, length = _entries_cache_header.unpack_from(data, 0)
+    if magic != _entries_cache_magic:
+        raise ValueError("Not a parsed cache")
+    offset = _entries_cache_header.size
+    metadata = json.loads(data[offset : offset + length])
+    if metadata["key"] != key:
+        return None
+    offset += length
+    count = metadata["count"]
+    columns = []
+    for _ in range(3):
+        column = array("I")
+        size = count * column.itemsize
+        column.frombytes(data[offset : offset + size])
+        if len(column) != count:
+            raise ValueError("The parsed cache is truncated")
+        if sys.byteorder != "little":
+            column.byteswap()
+        columns.append(column)
+        offset += size
+    entries = entries_class(entries=(), name=metadata["name"])
+    entries._set_columns(
+        columns[0],
+        columns[1],
+        columns[2],
+        [_intern(_value_from_json(value)) for value in metadata["values"]],
+    )
+    entries._missing_entries = [
+        UnicodeDataEntry(min, max, _value_from_json(value))
+        for min, max, value in metadata["missing"]
+    ]
+    return entries
+
 
 class UnicodeDataReader(object):
     """Read [Unicode character database] data files.
 
     This class parses data in the [Unicode character database].
 
-    By default, it downloads the data files from
+    By default, it downloads the data files of the latest version from
     <https://www.unicode.org/Public/UNIDATA/>.
+    The `version` argument, such as `"15.0.0"`, selects the files of the
+    version from `https://www.unicode.org/Public/<version>/ucd/`.
     Custom loader can be used by the constructor argument.
 
     [Unicode character database]: https://unicode.org/reports/tr44/
@@ -24,11 +184,18 @@ class UnicodeDataReader(object):
 
     default: "UnicodeDataReader" = None  # type: ignore
     is_caching_allowed = True
+    # The Unicode version such as `"15.0.0"`, or `None` for the latest.
+    version: Optional[str] = None
 
     def __init__(
-        self, url_template: str = "https://www.unicode.org/Public/UNIDATA/{0}.txt"
+        self, url_template: Optional[str] = None, version: Optional[str] = None
     ) -> None:
+        if url_template is None:
+            url_template = UnicodeDataReader.url_template_for_version(version)
         self.url_template = url_template
+        self.version = version
+        # HTTP connections are kept alive for each thread.
+        self._local = threading.local()
 
     class Context(object):
         """This class changes `UnicodeDataReader.default` while in the context,
@@ -47,55 +214,83 @@ class UnicodeDataReader(object):
             return None
 
     def bidi_brackets(self) -> UnicodeDataEntries:
-        name = "BidiBrackets"
-        lines = self.read_lines(name)
-        return UnicodeBidiBracketsDataEntries(name=name, lines=lines)
+        return self.read_entries("BidiBrackets", UnicodeBidiBracketsDataEntries)
 
     def blocks(self) -> UnicodeDataEntries:
-        name = "Blocks"
-        lines = self.read_lines(name)
-        return UnicodeDataEntries(name=name, lines=lines)
+        return self.read_entries("Blocks")
 
     def east_asian_width(self) -> UnicodeDataEntries:
-        name = "EastAsianWidth"
-        lines = self.read_lines(name)
-        return UnicodeDataEntries(name=name, lines=lines)
+        return self.read_entries("EastAsianWidth")
 
     def emoji(self) -> UnicodeDataEntries:
-        lines = self.read_lines("emoji/emoji-data")
-        return UnicodeEmojiDataEntries(name="Emoji", lines=lines)
+        return self.read_entries(
+            "emoji/emoji-data", UnicodeEmojiDataEntries, entries_name="Emoji"
+        )
 
     def general_category(self) -> UnicodeDataEntries:
-        lines = self.read_lines("extracted/DerivedGeneralCategory")
-        entries = UnicodeDataEntries(name="GeneralCategory", lines=lines)
-        # `extracted/DerivedGeneralCategory` is not sorted.
-        entries.sort()
-        return entries
+        return self.read_entries(
+            "extracted/DerivedGeneralCategory",
+            UnicodeGeneralCategoryDataEntries,
+            entries_name="GeneralCategory",
+        )
 
     def line_break(self) -> UnicodeDataEntries:
-        name = "LineBreak"
-        lines = self.read_lines(name)
-        return UnicodeLineBreakDataEntries(name=name, lines=lines)
+        return self.read_entries("LineBreak", UnicodeLineBreakDataEntries)
 
     def name(self) -> UnicodeDataEntries:
-        lines = self.read_lines("extracted/DerivedName")
-        entries = UnicodeDataEntries(name="Name", lines=lines)
-        return entries
+        return self.read_entries("extracted/DerivedName", entries_name="Name")
 
     def scripts(self) -> UnicodeDataEntries:
-        name = "Scripts"
-        lines = self.read_lines(name)
-        return UnicodeDataEntries(name=name, lines=lines)
+        return self.read_entries("Scripts")
 
     def script_extensions(self) -> UnicodeDataEntries:
-        name = "ScriptExtensions"
-        lines = self.read_lines(name)
-        return UnicodeScriptExtensionsDataEntries(name=name, lines=lines)
+        return self.read_entries("ScriptExtensions", UnicodeScriptExtensionsDataEntries)
 
     def vertical_orientation(self) -> UnicodeDataEntries:
-        name = "VerticalOrientation"
+        return self.read_entries(
+            "VerticalOrientation", UnicodeVerticalOrientationDataEntries
+        )
+
+    def read_entries(
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries] = UnicodeDataEntries,
+        entries_name: Optional[str] = None,
+    ) -> UnicodeDataEntries:
+        """Reads the file `name` and parses it into `entries_class`.
+
+        `entries_name` is the `name` of the entries. It is `name` if omitted.
+        """
         lines = self.read_lines(name)
-        return UnicodeVerticalOrientationDataEntries(name=name, lines=lines)
+        return entries_class(name=entries_name or name, lines=lines)
+
+    def prefetch(self, names: Iterable[str], max_workers: Optional[int] = 8) -> None:
+        """Reads the files `names` concurrently.
+
+        This is useful with `UnicodeDataCachedReader` to fill the cache at once.
+        """
+        _map_concurrently(self.read_lines, names, max_workers)
+
+    def load_many(
+        self, properties: Iterable[str], max_workers: Optional[int] = 8
+    ) -> Dict[str, UnicodeDataEntries]:
+        """Loads entries concurrently, and returns a `dict` of them.
+
+        `properties` are the names of the methods such as `"line_break"`.
+        """
+
+        def load(property: str) -> UnicodeDataEntries:
+            entries = getattr(self, property)()
+            len(entries)  # Parse in the worker thread.
+            return entries
+
+        return _map_concurrently(load, properties, max_workers)
+
+    @staticmethod
+    def url_template_for_version(version: Optional[str] = None) -> str:
+        if version:
+            return f"https://www.unicode.org/Public/{version}/ucd/{{0}}.txt"
+        return "https://www.unicode.org/Public/UNIDATA/{0}.txt"
 
     def get_url(self, name: str) -> str:
         return self.url_template.format(name)
@@ -103,60 +298,468 @@ class UnicodeDataReader(object):
     def read_lines(self, name: str) -> Iterable[str]:
         url = self.get_url(name)
         _logger.debug("Downloading %s", url)
-        with urllib.request.urlopen(url) as response:
-            body = response.read().decode("utf-8")
+        body = self._read_url(url).decode("utf-8")
         return body.splitlines(keepends=True)
 
+    def _read_url(self, url: str, redirects: int = 5) -> bytes:
+        import http.client
+        import urllib.error
+        import urllib.parse
+
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or self._has_proxy(parts):
+            # `urlopen` handles other schemes and proxies.
+            import urllib.request
+
+            with urllib.request.urlopen(url) as response:
+                return response.read()
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        for retry in (True, False):
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", path, headers={"User-Agent": __name__})
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # The server may have closed an idle connection.
+                self._close_connection(parts.scheme, parts.netloc)
+                if not retry:
+                    raise
+        if response.will_close:
+            self._close_connection(parts.scheme, parts.netloc)
+
+        if response.status in (301, 302, 303, 307, 308) and redirects > 0:
+            location = urllib.parse.urljoin(url, response.headers["Location"])
+            return self._read_url(location, redirects - 1)
+        if response.status != 200:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return body
+
+    @staticmethod
+    def _has_proxy(parts: "urllib.parse.SplitResult") -> bool:
+        import urllib.request
+
+        # Check the environment variables such as `HTTPS_PROXY` and `NO_PROXY`
+        # first, without reading the system settings that may be slow.
+        environment = urllib.request.getproxies_environment()
+        if environment:
+            if parts.scheme not in environment:
+                return False
+            return not urllib.request.proxy_bypass_environment(
+                parts.netloc, environment
+            )
+        if parts.scheme not in urllib.request.getproxies():
+            return False
+        return not urllib.request.proxy_bypass(parts.hostname or "")
+
+    def _connection(self, scheme: str, netloc: str) -> "http.client.HTTPConnection":
+        import http.client
+
+        connections = self._local.__dict__.setdefault("connections", {})
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            if scheme == "https":
+                connection = http.client.HTTPSConnection(netloc, timeout=60)
+            else:
+                connection = http.client.HTTPConnection(netloc, timeout=60)
+            connections[(scheme, netloc)] = connection
+        return connection
+
+    def _close_connection(self, scheme: str, netloc: str) -> None:
+        connections = self._local.__dict__.get("connections", {})
+        connection = connections.pop((scheme, netloc), None)
+        if connection:
+            connection.close()
+
 
 class UnicodeDataCachedReader(UnicodeDataReader):
-    try:
-        import platformdirs
+    """Caches files read by `reader` in `cache_dir`.
+
+    Files of a specific `version` are cached in `<cache_dir>/<version>/`, so
+    that files of different versions can be cached side by side.
+    ```python
+    reader = UnicodeDataCachedReader(UnicodeDataReader(version="15.0.0"))
+    ```
+    """
 
-        _default_cache_dir = Path(platformdirs.user_cache_dir("UNIDATA"))
-        _logger.debug("cache_dir: %s", _default_cache_dir)
-    except ModuleNotFoundError:
-        _default_cache_dir = None
+    # Resolved by `_get_default_cache_dir()` when it is first needed.
+    _default_cache_dir: Optional[Path] = None
+    _is_default_cache_dir_resolved = False
 
     def __init__(
         self,
-        reader: UnicodeDataReader = UnicodeDataReader(),
+        reader: Optional[UnicodeDataReader] = None,
         cache_dir: Optional[Path] = None,
     ):
-        self._reader = reader
+        self._reader = reader or UnicodeDataReader()
         self._cache_dir = cache_dir
 
+    @property
+    def version(self) -> Optional[str]:  # type: ignore[override]
+        return self._reader.version
+
     def read_lines(self, name: str) -> Iterable[str]:
         cache = self._cache_path(name)
-        if cache and cache.exists():
-            _logger.debug("Reading cache %s", cache)
-            return cache.read_text(encoding="utf-8").splitlines(keepends=True)
+        if not cache:
+            return self._reader.read_lines(name)
+        if cache.exists():
+            return self._read_cache(cache)
+
+        # Lock the cache so that only one process downloads the file, and
+        # others wait for it.
+        with _lock_file(cache):
+            if cache.exists():
+                return self._read_cache(cache)
+            lines = self._reader.read_lines(name)
+            _logger.debug("Writing cache %s", cache)
+            _write_atomically(cache, "".join(lines).encode("utf-8"))
+        return lines
 
-        lines = self._reader.read_lines(name)
+    @staticmethod
+    def _read_cache(cache: Path) -> Iterable[str]:
+        _logger.debug("Reading cache %s", cache)
+        return cache.read_text(encoding="utf-8").splitlines(keepends=True)
 
-        if cache:
-            cache.parent.mkdir(parents=True, exist_ok=True)
-            with cache.open("w", encoding="utf-8") as file:
-                _logger.debug("Writing cache %s", cache)
-                file.writelines(lines)
+    def read_entries(
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries] = UnicodeDataEntries,
+        entries_name: Optional[str] = None,
+    ) -> UnicodeDataEntries:
+        """Reads entries from the parsed cache if it is up to date, or reads
+        and parses the file and updates the parsed cache.
+
+        The parsed cache is keyed by the hash of the file, the `entries_class`,
+        and its `parser_version`. It has the columns of ranges as arrays, and
+        the value table as JSON, so that reading it does not run any code.
+        """
+        cache = self._cache_path(name)
+        if not cache:
+            return super().read_entries(name, entries_class, entries_name)
+        if not cache.exists():
+            self.read_lines(name)
+        source = cache.read_bytes()
+        key = [
+            _entries_cache_format_version,
+            entries_class.parser_version,
+            f"{entries_class.__module__}.{entries_class.__qualname__}",
+            entries_name or name,
+            hashlib.sha256(source).hexdigest(),
+        ]
+        entries_cache = self._entries_cache_path(cache)
+        entries = self._read_entries_cache(entries_cache, key, entries_class)
+        if entries is not None:
+            return entries
+
+        with _lock_file(entries_cache):
+            entries = self._read_entries_cache(entries_cache, key, entries_class)
+            if entries is not None:
+                return entries
+            lines = source.decode("utf-8").splitlines(keepends=True)
+            entries = entries_class(name=entries_name or name, lines=lines)
+            entries.missing_entries()
+            try:
+                data = _entries_to_bytes(entries, key)
+            except TypeError as e:
+                # Values of unknown types are not cached.
+                _logger.debug("Not caching %s: %s", entries_cache, e)
+                return entries
+            _logger.debug("Writing cache %s", entries_cache)
+            _write_atomically(entries_cache, data)
+        return entries
 
-        return lines
+    @staticmethod
+    def _entries_cache_path(cache: Path) -> Path:
+        return cache.with_name(cache.name + ".entries")
+
+    @staticmethod
+    def _read_entries_cache(
+        cache: Path, key: list, entries_class: Type[UnicodeDataEntries]
+    ) -> Optional[UnicodeDataEntries]:
+        if not cache.exists():
+            return None
+        _logger.debug("Reading cache %s", cache)
+        try:
+            entries = _entries_from_bytes(entries_class, cache.read_bytes(), key)
+        except Exception as e:
+            _logger.warning("Ignoring the broken cache %s: %s", cache, e)
+            return None
+        if entries is None:
+            _logger.debug("Cache %s is out of date", cache)
+        return entries
 
     def _cache_path(self, name: str) -> Optional[Path]:
         if not UnicodeDataCachedReader.is_caching_allowed:
             return None
-        if self._cache_dir:
-            return self._cache_dir / name
-        cache_dir = UnicodeDataCachedReader._default_cache_dir
-        if cache_dir:
-            return cache_dir / name
-        return None
+        cache_dir = self._cache_dir or UnicodeDataCachedReader._get_default_cache_dir()
+        if not cache_dir:
+            return None
+        version = self.version
+        if version:
+            return cache_dir / version / name
+        return cache_dir / name
+
+    @staticmethod
+    def _get_default_cache_dir() -> Optional[Path]:
+        cls = UnicodeDataCachedReader
+        if not cls._is_default_cache_dir_resolved:
+            try:
+                import platformdirs
+
+                cls._default_cache_dir = Path(platformdirs.user_cache_dir("UNIDATA"))
+                _logger.debug("cache_dir: %s", cls._default_cache_dir)
+            except ModuleNotFoundError:
+                cls._default_cache_dir = None
+            cls._is_default_cache_dir_resolved = True
+        return cls._default_cache_dir
 
     @staticmethod
     def clear_cache(ignore_errors: bool = False):
-        cache_dir = UnicodeDataCachedReader._default_cache_dir
+        cache_dir = UnicodeDataCachedReader._get_default_cache_dir()
         if cache_dir and cache_dir.exists():
+            import shutil
+
             _logger.debug("Deleting cache %s", cache_dir)
             shutil.rmtree(cache_dir, ignore_errors=ignore_errors)
 
 
-UnicodeDataReader.default = UnicodeDataCachedReader()
+class UnicodeDataZipReader(UnicodeDataReader):
+    """Reads data files from a local `UCD.zip` archive.
+
+    The archive is kept open, and files are read directly from it without
+    extracting them.
+    ```python
+    with UnicodeDataZipReader("UCD.zip") as reader:
+        lb = reader.line_break()
+    ```
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        import zipfile
+
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._lock = threading.Lock()
+        # Some archives have all files in a directory.
+        members = [m for m in self._zip.namelist() if m.endswith(".txt")]
+        dirs = set(m.split("/", 1)[0] for m in members)
+        if len(dirs) == 1 and all("/" in m for m in members):
+            self._prefix = f"{dirs.pop()}/"
+        else:
+            self._prefix = ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._zip.close()
+
+    def get_url(self, name: str) -> str:
+        return f"{self.path}/{self._member(name)}"
+
+    def _member(self, name: str) -> str:
+        member = f"{self._prefix}{name}.txt"
+        try:
+            self._zip.getinfo(member)
+        except KeyError:
+            raise FileNotFoundError(f"{member} is not in {self.path}") from None
+        return member
+
+    def read_lines(self, name: str) -> Iterable[str]:
+        member = self._member(name)
+        _logger.debug("Reading %s from %s", member, self.path)
+        with self._lock:
+            with self._zip.open(member) as file:
+                body = file.read().decode("utf-8")
+        return body.splitlines(keepends=True)
+
+
+class UnicodeDataMemoizedReader(UnicodeDataReader):
+    """Keeps loaded entries in memory to share them across callers.
+
+    Each call returns a `copy()` of the loaded entries. Copies share the
+    columns, so they are cheap, and changes to one of them, such as
+    `fill_missing_values()`, do not affect others.
+
+    Up to `maxsize` files are kept, and the least recently used ones are
+    discarded when more files are loaded.
+
+    To share entries across the process:
+    ```python
+    UnicodeDataReader.default = UnicodeDataMemoizedReader(UnicodeDataReader.default)
+    ```
+    """
+
+    def __init__(self, reader: UnicodeDataReader, maxsize: int = 16):
+        assert maxsize > 0
+        self._reader = reader
+        self._maxsize = maxsize
+        self._entries: collections.OrderedDict[tuple, UnicodeDataEntries] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:  # type: ignore[override]
+        return self._reader.version
+
+    def read_lines(self, name: str) -> Iterable[str]:
+        return self._reader.read_lines(name)
+
+    def read_entries(
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries] = UnicodeDataEntries,
+        entries_name: Optional[str] = None,
+    ) -> UnicodeDataEntries:
+        key = (name, entries_class, entries_name)
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries is not None:
+                self._entries.move_to_end(key)
+                return entries.copy()
+
+        entries = self._reader.read_entries(name, entries_class, entries_name)
+        # Resolve lazy states before sharing.
+        entries.missing_entries()
+        with self._lock:
+            self._entries[key] = entries
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                discarded, _ = self._entries.popitem(last=False)
+                _logger.debug("Discarding %s", discarded[0])
+        return entries.copy()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Discards the loaded entries of the file `name`, or all files."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+
+class UnicodeDataCompiledReader(UnicodeDataReader):
+    """Reads compiled lookup tables instead of entries.
+
+    Accessors such as `line_break()` return `UnicodeDataCompiledEntries`
+    instead of `UnicodeDataEntries`. Tables are compiled once, and saved next
+    to the cache of `reader` as `<name>.table`. Saved tables are
+    memory-mapped, so that processes share one physical copy of them.
+
+    The tables support lookups such as `value()`, `values()`, and
+    `values_for_str()`, and iterating, `filter()`, and `unicodes()`, with
+    missing values filled as in `fill_missing_values()`. They can't be
+    modified, or generate files by `UnicodeDataCompressor`.
+    ```python
+    UnicodeDataReader.default = UnicodeDataCompiledReader()
+    ```
+    """
+
+    # Increment when the binary format of the compiled tables changes.
+    compiler_version = 2
+
+    def __init__(self, reader: Optional[UnicodeDataCachedReader] = None):
+        self._reader = reader or UnicodeDataCachedReader()
+        self._tables: Dict[tuple, UnicodeDataCompiledEntries] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:  # type: ignore[override]
+        return self._reader.version
+
+    def read_lines(self, name: str) -> Iterable[str]:
+        return self._reader.read_lines(name)
+
+    def read_entries(  # type: ignore[override]
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries] = UnicodeDataEntries,
+        entries_name: Optional[str] = None,
+    ) -> UnicodeDataCompiledEntries:
+        key = (name, entries_class, entries_name)
+        with self._lock:
+            table = self._tables.get(key)
+        if table is None:
+            table = self._read_table(name, entries_class, entries_name)
+            with self._lock:
+                table = self._tables.setdefault(key, table)
+        return table
+
+    def _read_table(
+        self,
+        name: str,
+        entries_class: Type[UnicodeDataEntries],
+        entries_name: Optional[str],
+    ) -> UnicodeDataCompiledEntries:
+        cache = self._reader._cache_path(name)
+        if not cache:
+            return self._reader.read_entries(
+                name, entries_class, entries_name
+            ).compile()
+        if not cache.exists():
+            self._reader.read_lines(name)
+        stat = cache.stat()
+        key = [
+            UnicodeDataCompiledReader.compiler_version,
+            entries_class.parser_version,
+            f"{entries_class.__module__}.{entries_class.__qualname__}",
+            entries_name or name,
+            stat.st_size,
+            stat.st_mtime_ns,
+        ]
+        table_path = cache.with_name(cache.name + ".table")
+        table = self._load_table(table_path, key)
+        if table is not None:
+            return table
+
+        with _lock_file(table_path):
+            table = self._load_table(table_path, key)
+            if table is not None:
+                return table
+            entries = self._reader.read_entries(name, entries_class, entries_name)
+            _logger.debug("Writing compiled table %s", table_path)
+            _write_atomically(table_path, entries.compile().tobytes(key))
+        table = self._load_table(table_path, key)
+        assert table is not None
+        return table
+
+    @staticmethod
+    def _load_table(path: Path, key: list) -> Optional[UnicodeDataCompiledEntries]:
+        if not path.exists():
+            return None
+        try:
+            table = UnicodeDataCompiledEntries.load(path)
+        except Exception as e:
+            _logger.warning("Ignoring the broken table %s: %s", path, e)
+            return None
+        if table._key != key:
+            _logger.debug("Table %s is out of date", path)
+            return None
+        _logger.debug("Mapped table %s", path)
+        return table
+
+
+class _DefaultReader(object):
+    """Creates `UnicodeDataReader.default` when it is first used."""
+
+    def __get__(self, instance, owner) -> UnicodeDataReader:
+        reader = UnicodeDataCachedReader()
+        # Replace this descriptor with the created reader.
+        UnicodeDataReader.default = reader
+        return reader
+
+
+UnicodeDataReader.default = _DefaultReader()  # type: ignore
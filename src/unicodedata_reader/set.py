@@ -1,6 +1,9 @@
+import bisect
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 
 from unicodedata_reader.entry import *
@@ -8,17 +11,63 @@ from unicodedata_reader.reader import *
 
 
 class Set(object):
-    """A simple wrapper of a `set` of Unicode code points."""
+    """A set of Unicode code points.
+
+    The set is stored as a sorted list of disjoint ranges, as an "inversion
+    list"; even indices are the first code points of ranges, and odd indices
+    are the code points after the last code points of ranges.
+    Set operations are linear to the number of ranges, not code points.
+    """
 
     def __init__(
         self,
         entries: Optional[UnicodeDataEntries] = None,
         predicate: Optional[Callable[[Any], bool]] = None,
     ) -> None:
-        self.set = set()
+        self._list: List[int] = []
         if entries:
             assert predicate is not None
-            entries.add_to_set(predicate, self.set)
+            self._list = self._list_from_entries(entries.filter(predicate))
+
+    @staticmethod
+    def _list_from_entries(entries: Iterable[UnicodeDataEntry]) -> List[int]:
+        list = []
+        for entry in sorted(entries, key=lambda e: e.min):
+            if list and entry.min <= list[-1]:
+                if entry.max >= list[-1]:
+                    list[-1] = entry.max + 1
+                continue
+            list.append(entry.min)
+            list.append(entry.max + 1)
+        return list
+
+    @staticmethod
+    def _merge(
+        a: List[int], b: List[int], op: Callable[[bool, bool], bool]
+    ) -> List[int]:
+        # Walk boundaries of both lists, and add boundaries where the result of
+        # `op` changes.
+        result = []
+        a_len = len(a)
+        b_len = len(b)
+        i = j = 0
+        in_a = in_b = in_result = False
+        while i < a_len or j < b_len:
+            if j >= b_len or (i < a_len and a[i] <= b[j]):
+                code = a[i]
+            else:
+                code = b[j]
+            if i < a_len and a[i] == code:
+                in_a = not in_a
+                i += 1
+            if j < b_len and b[j] == code:
+                in_b = not in_b
+                j += 1
+            in_code = op(in_a, in_b)
+            if in_code != in_result:
+                result.append(code)
+                in_result = in_code
+        return result
 
     @staticmethod
     def east_asian_width(*values: str) -> "Set":
@@ -63,25 +112,55 @@ class Set(object):
         return Set(entries, lambda v: bool(set(v) & s))
 
     def __contains__(self, code_point: int) -> bool:
-        return code_point in self.set
+        return bool(bisect.bisect_right(self._list, code_point) & 1)
 
     def __iter__(self) -> Iterator[int]:
-        return self.set.__iter__()
+        list = self._list
+        for i in range(0, len(list), 2):
+            yield from range(list[i], list[i + 1])
 
     def __isub__(self, other: "Set") -> "Set":
-        self.set -= other.set
+        self._list = self._merge(self._list, other._list, lambda a, b: a and not b)
         return self
 
     def __iand__(self, other: "Set") -> "Set":
-        self.set &= other.set
+        self._list = self._merge(self._list, other._list, lambda a, b: a and b)
         return self
 
     def __ior__(self, other: "Set") -> "Set":
-        self.set |= other.set
+        self._list = self._merge(self._list, other._list, lambda a, b: a or b)
         return self
 
     def add(self, code: int) -> None:
-        self.set.add(code)
+        list = self._list
+        i = bisect.bisect_right(list, code)
+        if i & 1:
+            return
+        # `list[i - 1] <= code < list[i]`, and `code` is not in the set.
+        join_previous = i > 0 and list[i - 1] == code
+        join_next = i < len(list) and list[i] == code + 1
+        if join_previous and join_next:
+            del list[i - 1 : i + 1]
+        elif join_previous:
+            list[i - 1] = code + 1
+        elif join_next:
+            list[i] = code
+        else:
+            list[i:i] = (code, code + 1)
 
     def remove(self, code: int) -> None:
-        self.set.discard(code)
+        list = self._list
+        i = bisect.bisect_right(list, code)
+        if not i & 1:
+            return
+        # `list[i - 1] <= code < list[i]`, and `code` is in the set.
+        is_first = list[i - 1] == code
+        is_last = list[i] == code + 1
+        if is_first and is_last:
+            del list[i - 1 : i + 1]
+        elif is_first:
+            list[i - 1] = code + 1
+        elif is_last:
+            list[i] = code
+        else:
+            list[i:i] = (code, code + 1)
@@ -0,0 +1,140 @@
+import argparse
+import logging
+import pathlib
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from .compiled import UnicodeDataCompiledEntries
+from .reader import UnicodeDataCachedReader
+from .reader import UnicodeDataReader
+
+_logger = logging.getLogger("UnicodeDataSnapshot")
+
+# The methods of `UnicodeDataReader` that `snapshot` can compile.
+_properties = (
+    "bidi_brackets",
+    "blocks",
+    "east_asian_width",
+    "emoji",
+    "general_category",
+    "line_break",
+    "name",
+    "scripts",
+    "script_extensions",
+    "vertical_orientation",
+)
+
+
+class UnicodeDataSnapshot(object):
+    """Compiled tables of properties, to save as a Python module or as binary
+    files.
+
+    A saved snapshot loads without reading or parsing the data files; a Python
+    module has the tables in `bytes` constants, and lookups read them
+    directly.
+    ```sh
+    unicodedata-reader snapshot line_break general_category -o ucd15.py
+    ```
+    ```python
+    import ucd15
+    print(ucd15.line_break[0x41])
+    ```
+    """
+
+    def __init__(
+        self,
+        tables: Dict[str, UnicodeDataCompiledEntries],
+        version: Optional[str] = None,
+    ):
+        self.tables = tables
+        self.version = version
+
+    @staticmethod
+    def from_reader(
+        reader: UnicodeDataReader, properties: Iterable[str], shift: int = 7
+    ) -> "UnicodeDataSnapshot":
+        """Compiles `properties`, the names of the methods of `reader` such as
+        `"line_break"`."""
+        tables = {}
+        for property, entries in reader.load_many(properties).items():
+            tables[property] = entries.compile(shift=shift)
+        return UnicodeDataSnapshot(tables, version=reader.version)
+
+    def to_python(self) -> str:
+        """Returns the source code of a Python module of this snapshot."""
+        lines: List[str] = [
+            "# Generated by `unicodedata-reader snapshot`. Do not edit.",
+            "from unicodedata_reader.compiled import UnicodeDataCompiledEntries",
+            "",
+            f"unicode_version = {self.version!r}",
+            f"__all__ = {['unicode_version', *self.tables]!r}",
+        ]
+        for property, table in self.tables.items():
+            lines.append("")
+            lines.append(f"{property} = UnicodeDataCompiledEntries.frombytes(")
+            lines.append("    b''")
+            data = table.tobytes()
+            for start in range(0, len(data), 32):
+                lines.append(f"    {data[start : start + 32]!r}")
+            lines.append(")")
+        lines.append("")
+        return "\n".join(lines)
+
+    def save(self, output: pathlib.Path) -> None:
+        """Saves this snapshot to `output`.
+
+        If `output` ends with `.py`, it is a Python module. Otherwise `output` is
+        a directory, and `<property>.table` files are saved in it. The files
+        can be loaded by `UnicodeDataCompiledEntries.load()`.
+        """
+        if output.suffix == ".py":
+            output.write_text(self.to_python(), newline="\n")
+            _logger.info("Saved to %s", output)
+            return
+        output.mkdir(parents=True, exist_ok=True)
+        for property, table in self.tables.items():
+            path = output / f"{property}.table"
+            table.save(path)
+            _logger.info("Saved to %s", path)
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "properties",
+        nargs="+",
+        choices=_properties,
+        metavar="property",
+        help=f"the properties to compile; {', '.join(_properties)}",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        required=True,
+        help="a Python module (*.py), or a directory for binary files",
+    )
+    parser.add_argument(
+        "--ucd-version", help="the Unicode version such as 15.0.0 (latest)"
+    )
+    parser.add_argument("--shift", type=int, default=7)
+    parser.add_argument(
+        "-v", "--verbose", help="increase output verbosity", action="count", default=0
+    )
+    parsed = parser.parse_args(args)
+    logging.basicConfig(level=logging.DEBUG if parsed.verbose else logging.INFO)
+
+    if parsed.ucd_version:
+        reader = UnicodeDataCachedReader(UnicodeDataReader(version=parsed.ucd_version))
+    else:
+        reader = UnicodeDataReader.default
+    snapshot = UnicodeDataSnapshot.from_reader(
+        reader, parsed.properties, shift=parsed.shift
+    )
+    snapshot.save(parsed.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+from unicodedata_reader import *
+
+
+class _ThreadRecordingReader(UnicodeDataReader):
+    def __init__(self, url_template: str):
+        super().__init__(url_template)
+        self.threads = []
+
+    def read_lines(self, name: str):
+        self.threads.append(threading.current_thread())
+        return super().read_lines(name)
+
+
+def test_async_reader(server):
+    reader = _ThreadRecordingReader(server.url_template)
+    async_reader = AsyncUnicodeDataReader(reader)
+
+    async def main():
+        return await asyncio.gather(
+            *(async_reader.line_break() for _ in range(5)), async_reader.scripts()
+        )
+
+    server.delay = 0.05
+    results = asyncio.run(main())
+    assert server.requests == {"LineBreak": 1, "Scripts": 1}
+    assert threading.current_thread() not in reader.threads
+    line_breaks = results[:5]
+    for entries in line_breaks:
+        assert entries.value(0x41) == "AL"
+    # Each caller gets its own copy.
+    assert len(dict.fromkeys(map(id, line_breaks))) == len(line_breaks)
+    assert results[5].name == "Scripts"
+
+    # Requests are not deduplicated once completed.
+    asyncio.run(async_reader.line_break())
+    assert server.requests["LineBreak"] == 2
+
+
+def test_async_reader_cancel(server):
+    async_reader = AsyncUnicodeDataReader(UnicodeDataReader(server.url_template))
+
+    async def main():
+        server.delay = 0.1
+        cancelled = asyncio.ensure_future(async_reader.line_break())
+        other = asyncio.ensure_future(async_reader.line_break())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        return await other
+
+    assert asyncio.run(main()).value(0x41) == "AL"
+    assert server.requests == {"LineBreak": 1}
+
+
+def test_async_cached_reader(server, tmp_path):
+    async_reader = AsyncUnicodeDataCachedReader(
+        UnicodeDataReader(server.url_template), tmp_path
+    )
+
+    async def main():
+        lines = await async_reader.read_lines("EastAsianWidth")
+        entries = await async_reader.load_many(["east_asian_width", "line_break"])
+        return lines, entries
+
+    lines, entries = asyncio.run(main())
+    assert server.requests == {"EastAsianWidth": 1, "LineBreak": 1}
+    assert (tmp_path / "EastAsianWidth").exists()
+    assert (tmp_path / "LineBreak.entries").exists()
+    assert len(lines) > 0
+    assert list(entries.keys()) == ["east_asian_width", "line_break"]
+    assert entries["east_asian_width"].value(0x41) == "Na"
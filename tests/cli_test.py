@@ -1,4 +1,11 @@
+import sys
+
+import pytest
+
 from unicodedata_reader import *
+from unicodedata_reader.line_break import UnicodeLineBreakDataCli
+
+from .conftest import root_dir
 
 
 def _to_unicodes(text):
@@ -29,3 +36,30 @@ def test_to_unicodes_range():
 
 def test_to_unicodes_array():
     assert _to_unicodes(["1234", "5678"]) == (0x1234, 0x5678)
+
+
+@pytest.mark.parametrize(
+    "template, encoder",
+    [
+        ("template.js", None),
+        ("template-packed.js", None),
+        ("template-packed.js", "auto"),
+        ("template-packed.js", "packed"),
+    ],
+)
+def test_template(tmp_path, monkeypatch, template, encoder):
+    # The default encoder is the encoder the template decodes.
+    args = ["lb", "-t", str(root_dir / "js" / template), "-o", str(tmp_path)]
+    if encoder:
+        args += ["-e", encoder]
+    monkeypatch.setattr(sys, "argv", args)
+    UnicodeLineBreakDataCli().main()
+    assert (tmp_path / template.replace("template", "LineBreak")).exists()
+
+
+def test_template_mismatch(tmp_path, monkeypatch):
+    template = root_dir / "js" / "template-packed.js"
+    args = ["lb", "-t", str(template), "-o", str(tmp_path), "-e", "varint"]
+    monkeypatch.setattr(sys, "argv", args)
+    with pytest.raises(ValueError):
+        UnicodeLineBreakDataCli().main()
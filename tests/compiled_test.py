@@ -0,0 +1,145 @@
+import itertools
+
+import pytest
+
+from unicodedata_reader import *
+
+
+def _assert_same_values(entries, compiled):
+    codes = list(range(0, UnicodeDataEntry.max_code_point + 1, 97))
+    for entry in entries:
+        codes.extend((entry.min - 1, entry.min, entry.max, entry.max + 1))
+    codes = [c for c in codes if 0 <= c <= UnicodeDataEntry.max_code_point]
+    for code in codes:
+        assert compiled.value(code) == entries.value(code), hex(code)
+        assert compiled[code] == entries[code]
+    codes.sort()
+    assert compiled.values(codes) == entries.values(codes)
+
+
+def test_compile():
+    class TestEntries(UnicodeDataEntries):
+        def missing_value(self, code: int):
+            return "M" if code < 0x1000 else None
+
+    entries = TestEntries(
+        entries=(
+            UnicodeDataEntry(1, 3, "A"),
+            UnicodeDataEntry(5, 6, "B"),
+            UnicodeDataEntry(0x2000, 0x2FFF, "A"),
+        )
+    )
+    compiled = entries.compile()
+    expect = ("M", "A", "A", "A", "M", "B", "B", "M")
+    for code, value in enumerate(expect):
+        assert compiled.value(code) == value
+    assert compiled.value(0x1FFF) is None
+    assert compiled.value(0x2000) == "A"
+    assert compiled.value(UnicodeDataEntry.max_code_point) is None
+    assert compiled.value(UnicodeDataEntry.max_code_point + 1) is None
+
+    assert isinstance(compiled.value_as_int(1), int)
+    assert compiled.values_for_int()[compiled.value_as_int(1)] == "A"
+
+    # `compile()` should not change the original entries.
+    assert entries.values_for_int() is None
+    assert entries.value(1) == "A"
+
+
+def test_compile_line_break(reader):
+    lb = reader.line_break()
+    compiled = lb.compile()
+    assert compiled.nbytes < 100_000
+    assert compiled.value(0x41) == "AL"
+    assert compiled.value(0x378) == "XX"
+    assert compiled.value(0x3400) == "ID"
+    _assert_same_values(lb, compiled)
+
+    # The _integer values_ are the same as `map_values_to_int()`.
+    lb.fill_missing_values()
+    lb.map_values_to_int()
+    for code in (0x22, 0x41, 0x378, 0x3400):
+        assert compiled.value_as_int(code) == lb.value(code)
+
+
+def test_compile_general_category(reader):
+    gc = reader.general_category()
+    compiled = gc.compile()
+    assert compiled.value(0x41) == "Lu"
+    _assert_same_values(gc, compiled)
+
+
+def test_compile_scripts(reader):
+    # `Scripts.txt` is not sorted.
+    compiled = reader.scripts().compile()
+    assert compiled.value(0x41) == "Latin"
+    assert compiled.value(0x3041) == "Hiragana"
+    assert compiled.value(0x4E00) == "Han"
+    assert compiled.value(0x0378) == "Unknown"
+
+
+def test_compile_script_extensions(reader):
+    scx = reader.script_extensions()
+    compiled = scx.compile()
+    assert compiled.value(0x3001) == scx.value(0x3001)
+    assert isinstance(compiled.value(0x3001), list)
+    # The entries are not changed.
+    assert isinstance(scx.value(0x3001), list)
+
+
+def test_save_load(reader, tmp_path):
+    entries = reader.line_break()
+    compiled = entries.compile()
+    path = tmp_path / "LineBreak.table"
+    compiled.save(path, key=["test", 1])
+    loaded = UnicodeDataCompiledEntries.load(path)
+    assert loaded.name == "LineBreak"
+    assert loaded._key == ["test", 1]
+    assert isinstance(loaded._stage2, memoryview)
+    assert loaded.nbytes == compiled.nbytes
+    assert loaded.values_for_int() == compiled.values_for_int()
+    _assert_same_values(entries, loaded)
+
+    # A loaded table can be saved again.
+    assert loaded.tobytes(["test", 1]) == path.read_bytes()
+    assert UnicodeDataCompiledEntries.frombytes(path.read_bytes())[0x41] == "AL"
+
+
+def test_iter(reader):
+    entries = reader.east_asian_width()
+    compiled = entries.compile()
+    entries.fill_missing_values()
+    # `compile()` also fills missing values after the last entry.
+    runs = list(compiled)
+    assert runs[: len(entries)] == list(entries)
+    assert runs[-1] == UnicodeDataEntry(0x10FFFE, 0x10FFFF, "N")
+    assert list(compiled.filter(lambda v: v == "W")) == list(
+        entries.filter(lambda v: v == "W")
+    )
+    assert list(itertools.islice(compiled.unicodes(), 3)) == [0, 1, 2]
+
+
+def test_save_load_values():
+    values = [
+        ("Hira", "Kana"),
+        None,
+        EmojiType.Emoji | EmojiType.Emoji_Presentation,
+        BidiBrackets(0x29, "o"),
+    ]
+    entries = UnicodeDataEntries(
+        entries=[UnicodeDataEntry(i, i, value) for i, value in enumerate(values)]
+    )
+    data = entries.compile().tobytes()
+    assert b"pickle" not in data and b"\x80\x05" not in data
+    loaded = UnicodeDataCompiledEntries.frombytes(data)
+    assert loaded[0] == ("Hira", "Kana")
+    assert loaded[1] is None
+    assert loaded[2] == EmojiType.Emoji | EmojiType.Emoji_Presentation
+    assert (loaded[3].pair, loaded[3].type) == (0x29, "o")
+
+
+def test_load_broken(tmp_path):
+    path = tmp_path / "broken.table"
+    path.write_bytes(b"not a table" * 10)
+    with pytest.raises(ValueError):
+        UnicodeDataCompiledEntries.load(path)
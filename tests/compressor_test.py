@@ -0,0 +1,291 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from unicodedata_reader import *
+
+from .conftest import root_dir
+
+
+@pytest.mark.parametrize(
+    "template, encoder",
+    [
+        ("template.js", "varint"),
+        ("template-bsearch.js", "varint"),
+        ("template-2stage.js", "varint"),
+        ("template-packed.js", "packed"),
+        ("template-columns.js", "columns"),
+        ("template-blocks.js", "blocks"),
+    ],
+)
+def test_js_template(reader, tmp_path, template, encoder):
+    if not shutil.which("node"):
+        pytest.skip("node is not available")
+    entries = reader.line_break()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    compressor = UnicodeDataCompressor(entries, encoder=encoder)
+    compressor.substitute_template(root_dir / "js" / template, output=tmp_path)
+    path = tmp_path / template.replace("template", "LineBreak")
+    assert path.exists()
+
+    codes = list(range(0, 0x110000, 97))
+    for entry in entries:
+        codes.extend((entry.min, entry.max))
+    script = tmp_path / "test.js"
+    script.write_text(
+        f"{path.read_text()};"
+        f"console.log(JSON.stringify({json.dumps(codes)}.map(uLineBreak)))"
+    )
+    result = subprocess.run(
+        ("node", str(script)), capture_output=True, text=True, check=True
+    )
+    values = json.loads(result.stdout)
+    values_for_int = entries.values_for_int()
+    expected = [values_for_int[entries.value(code)] for code in codes]
+    assert values == expected
+
+
+def test_js_template_module(reader, tmp_path):
+    if not shutil.which("node"):
+        pytest.skip("node is not available")
+    entries = reader.scripts()
+    entries.sort()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    compressor = UnicodeDataCompressor(entries)
+    text = compressor.substitute_template(
+        root_dir / "js" / "template-module.mjs", output=tmp_path, binary=True
+    )
+    assert "BASE64" not in text
+    path = tmp_path / "Scripts-module.mjs"
+    assert path.exists()
+    assert (tmp_path / "Scripts.bin").read_bytes() == compressor.compress()
+
+    codes = list(range(0, list(entries)[-1].max + 1, 97))
+    script = tmp_path / "test.mjs"
+    script.write_text(
+        'import { readFile } from "node:fs/promises";'
+        "globalThis.fetch = async (url) => {"
+        "  const data = await readFile(url);"
+        "  return { ok: true, arrayBuffer: async () => data.buffer.slice("
+        "    data.byteOffset, data.byteOffset + data.byteLength) };"
+        "};"
+        'const module = await import("./Scripts-module.mjs");'
+        "let error;"
+        "try { module.uScripts(0); } catch (e) { error = e.message; }"
+        "const [loaded] = await Promise.all([module.load(), module.load()]);"
+        f"const codes = {json.dumps(codes)};"
+        "console.log(JSON.stringify({"
+        "error,"
+        "same: loaded === module.uScripts,"
+        "values: codes.map(module.uScripts),"
+        "}));"
+    )
+    result = subprocess.run(
+        ("node", str(script)), capture_output=True, text=True, check=True
+    )
+    result = json.loads(result.stdout)
+    assert result["error"]
+    assert result["same"]
+    values_for_int = entries.values_for_int()
+    expected = [values_for_int[entries.value(code)] for code in codes]
+    assert result["values"] == expected
+
+    with pytest.raises(ValueError):
+        compressor.substitute_template(
+            root_dir / "js" / "template-module.mjs", binary=True
+        )
+    # Templates with `$BINARY_FILE` need the binary file.
+    with pytest.raises(ValueError, match="binary"):
+        compressor.substitute_template(
+            root_dir / "js" / "template-module.mjs", output=tmp_path
+        )
+    # Templates without `$BINARY_FILE` can't load the binary file.
+    with pytest.raises(ValueError, match="binary"):
+        compressor.substitute_template(
+            root_dir / "js" / "template-bsearch.js", output=tmp_path, binary=True
+        )
+    # Only the varint encoder is supported.
+    compressor = UnicodeDataCompressor(entries, encoder="columns")
+    with pytest.raises(ValueError, match="binary"):
+        compressor.substitute_template(
+            root_dir / "js" / "template-columns.js", output=tmp_path, binary=True
+        )
+
+
+def _properties(reader):
+    properties = []
+    for entries in (
+        reader.line_break(),
+        reader.general_category(),
+        reader.east_asian_width(),
+    ):
+        entries.fill_missing_values()
+        entries.map_values_to_int()
+        properties.append(entries)
+    return properties
+
+
+def test_combine(reader):
+    properties = _properties(reader)
+    combined = UnicodeDataCompressor.combine(properties)
+    assert combined._is_contiguous()
+    values_for_int = combined.values_for_int()
+    for code in list(range(0, 0x10FFFE, 89)) + [entry.min for entry in combined]:
+        value = values_for_int[combined.value(code)]
+        assert value == tuple(entries.value(code) for entries in properties)
+
+    # Only the varint encoder is supported.
+    assert UnicodeDataCompressor(properties, encoder="auto").encoder.name == "varint"
+    with pytest.raises(ValueError):
+        UnicodeDataCompressor(properties, encoder="columns")
+
+    # Values are arrays of _integer values_ in JavaScript.
+    text = UnicodeDataCompressor(properties).substitute_template(
+        root_dir / "js" / "template.js", name="Properties"
+    )
+    value_list = ",".join(
+        json.dumps(list(value), separators=(",", ":")) for value in values_for_int
+    )
+    assert f"const uPropertiesValues = [{value_list}];" in text
+
+    # The combined one should be smaller than the sum of separate ones.
+    size = len(UnicodeDataCompressor(properties).compress())
+    separate_size = sum(
+        len(UnicodeDataCompressor(entries).compress()) for entries in properties
+    )
+    assert size < separate_size
+
+
+def test_js_template_multi(reader, tmp_path):
+    if not shutil.which("node"):
+        pytest.skip("node is not available")
+    properties = _properties(reader)
+    compressor = UnicodeDataCompressor(properties)
+    compressor.substitute_template(
+        root_dir / "js" / "template-multi.js", output=tmp_path, name="Properties"
+    )
+    path = tmp_path / "Properties-multi.js"
+    assert path.exists()
+
+    codes = list(range(0, 0x10FFFE, 97))
+    script = tmp_path / "test.js"
+    script.write_text(
+        f"{path.read_text()};"
+        f"const codes = {json.dumps(codes)};"
+        "console.log(JSON.stringify({"
+        "all: codes.map(uProperties),"
+        "lb: codes.map(uProperties.LineBreak),"
+        "}))"
+    )
+    result = subprocess.run(
+        ("node", str(script)), capture_output=True, text=True, check=True
+    )
+    values = json.loads(result.stdout)
+
+    def value(entries, code):
+        return entries.values_for_int()[entries.value(code)]
+
+    assert values["all"] == [
+        {entries.name: value(entries, code) for entries in properties} for code in codes
+    ]
+    assert values["lb"] == [value(properties[0], code) for code in codes]
+
+
+@pytest.mark.parametrize(
+    "template, encoder",
+    [
+        ("template.js", "packed"),
+        ("template-bsearch.js", "columns"),
+        ("template-blocks.js", "varint"),
+    ],
+)
+def test_template_encoder_mismatch(reader, template, encoder):
+    entries = reader.line_break()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    compressor = UnicodeDataCompressor(entries, encoder=encoder)
+    with pytest.raises(ValueError):
+        compressor.substitute_template(root_dir / "js" / template)
+
+
+def test_encoder_for_template():
+    for encoder in UnicodeDataCompressor.encoders.values():
+        for template in (encoder.template, *encoder.templates):
+            path = root_dir / "js" / template
+            assert path.exists()
+            assert UnicodeDataCompressor.encoder_for_template(path) == encoder.name
+    assert UnicodeDataCompressor.encoder_for_template(root_dir / "custom.js") is None
+
+
+def test_report(reader):
+    entries = reader.line_break()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    compressor = UnicodeDataCompressor(entries)
+    sizes = compressor.report()
+    assert [size.encoder for size in sizes] == list(UnicodeDataCompressor.encoders)
+    for size in sizes:
+        assert size.raw == len(compressor.compress(size.encoder))
+        assert size.base64 == (size.raw + 2) // 3 * 4
+    smallest = min(sizes, key=lambda size: size.gzip)
+    assert compressor.smallest_encoder() == smallest.encoder
+    auto = UnicodeDataCompressor(entries, encoder="auto")
+    assert auto.encoder.name == smallest.encoder
+    for encoder in UnicodeDataCompressor.encoders.values():
+        assert (root_dir / "js" / encoder.template).exists()
+
+
+@pytest.mark.parametrize("encoder", ["varint", "packed", "columns", "blocks"])
+@pytest.mark.parametrize("property", ["line_break", "east_asian_width"])
+def test_decompress(reader, encoder, property):
+    entries = getattr(reader, property)()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    compressor = UnicodeDataCompressor(entries, encoder=encoder)
+    data = compressor.compress()
+    decompressed = UnicodeDataCompressor.decompress(
+        data,
+        entries.values_for_int(),
+        encoder=encoder,
+        entry_count=len(entries),
+        name=entries.name,
+    )
+    assert decompressed.name == entries.name
+    assert decompressed.values_for_int() == entries.values_for_int()
+    if encoder == "blocks":
+        # Two-stage tables have missing values filled to the end.
+        codes = [code for entry in entries for code in (entry.min, entry.max)]
+        assert decompressed.values(codes) == entries.values(codes)
+    else:
+        assert list(decompressed) == list(entries)
+
+    # Round trip.
+    assert UnicodeDataCompressor(decompressed, encoder=encoder).compress() == data
+
+
+def test_decompress_small():
+    entries = UnicodeDataEntries(
+        entries=(
+            UnicodeDataEntry(0, 0, "A"),
+            UnicodeDataEntry(1, 300, "B"),
+            UnicodeDataEntry(301, 0x10FFFF, "A"),
+        )
+    )
+    entries.map_values_to_int()
+    for encoder in UnicodeDataCompressor.encoders:
+        data = UnicodeDataCompressor(entries).compress(encoder)
+        decompressed = UnicodeDataCompressor.decompress(
+            data, entries.values_for_int(), encoder=encoder, entry_count=3
+        )
+        assert list(decompressed) == list(entries), encoder
+
+    with pytest.raises(ValueError):
+        UnicodeDataCompressor.decompress(
+            UnicodeDataCompressor(entries).compress("columns"),
+            entries.values_for_int(),
+            encoder="columns",
+        )
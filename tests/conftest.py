@@ -1,6 +1,10 @@
+import http.server
 from pathlib import Path
 import pytest
 import sys
+import threading
+import time
+import urllib.parse
 
 from unicodedata_reader import UnicodeDataCachedReader
 from unicodedata_reader import UnicodeDataReader
@@ -18,3 +22,57 @@ UnicodeDataReader.default = _reader
 @pytest.fixture
 def reader() -> UnicodeDataReader:
     return _reader
+
+
+class UnicodeDataServer(http.server.ThreadingHTTPServer):
+    """A local stand-in of `unicode.org`, serving files in `cache_dir`."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _UnicodeDataRequestHandler)
+        self.url_template = f"http://127.0.0.1:{self.server_address[1]}/{{0}}.txt"
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = {}
+        # Seconds to wait before responding, to make races more likely.
+        self.delay = 0.0
+
+
+class _UnicodeDataRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: UnicodeDataServer
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        # The path is an absolute URL when this server is used as a proxy.
+        path = urllib.parse.urlsplit(self.path).path
+        name = path.lstrip("/").removesuffix(".txt")
+        with self.server.lock:
+            self.server.requests[name] = self.server.requests.get(name, 0) + 1
+        time.sleep(self.server.delay)
+        path = cache_dir / name
+        if not path.is_file():
+            self.send_error(404)
+            return
+        body = path.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = UnicodeDataServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
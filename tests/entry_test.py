@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from unicodedata_reader import *
@@ -79,6 +81,32 @@ def test_from_values_none():
     assert entries == expects
 
 
+def test_from_lines():
+    comments = []
+    lines = [
+        "# comment\n",
+        "\n",
+        "0041 ; A # trailing comment\n",
+        "0042..0044;B\n",
+        "  # indented comment\n",
+        "0045 ; C ; D # multiple columns\n",
+    ]
+    entries = UnicodeDataEntry.from_lines(
+        lines, comment=lambda c, i: comments.append((c, i))
+    )
+    assert tuple(entries) == (
+        UnicodeDataEntry(0x41, 0x41, "A"),
+        UnicodeDataEntry(0x42, 0x44, "B"),
+        UnicodeDataEntry(0x45, 0x45, ["C", "D"]),
+    )
+    assert comments == [("comment", 0), ("indented comment", 0)]
+
+
+def test_from_lines_invalid():
+    with pytest.raises(ValueError):
+        tuple(UnicodeDataEntry.from_lines(["0041\n"]))
+
+
 def test_value():
     entries = UnicodeDataEntries(
         entries=(
@@ -97,6 +125,124 @@ def test_value():
     assert values_for_code == expect
 
 
+def test_value_missing():
+    class TestEntries(UnicodeDataEntries):
+        def missing_value(self, code: int):
+            return "M"
+
+    entries = TestEntries(
+        entries=(
+            UnicodeDataEntry(0, 0, "A"),
+            UnicodeDataEntry(2, 4, "B"),
+            UnicodeDataEntry(5, 5, "C"),
+            UnicodeDataEntry(10, 20, "D"),
+        )
+    )
+    expect = ("A", "M", "B", "B", "B", "C", "M", "M", "M", "M", "D")
+    for code, value in enumerate(expect):
+        assert entries.value(code) == value
+    assert entries.value(20) == "D"
+    assert entries.value(21) == "M"
+    assert entries.value(UnicodeDataEntry.max_code_point) == "M"
+
+
+def test_value_after_sort():
+    entries = UnicodeDataEntries(
+        entries=(
+            UnicodeDataEntry(5, 6, "B"),
+            UnicodeDataEntry(1, 3, "A"),
+        )
+    )
+    entries.sort()
+    assert entries.value(0) is None
+    assert entries.value(2) == "A"
+    assert entries.value(4) is None
+    assert entries.value(6) == "B"
+
+
+def test_entries_columns():
+    entries = UnicodeDataEntries(
+        entries=(
+            UnicodeDataEntry(5, 6, "B"),
+            UnicodeDataEntry(1, 3, "A"),
+            UnicodeDataEntry(8, 8, "B"),
+            UnicodeDataEntry(10, 10, ["C", "D"]),
+            UnicodeDataEntry(12, 12, ["C", "D"]),
+        )
+    )
+    assert len(entries) == 5
+    # Values are deduplicated, except lists that are not hashable.
+    assert entries._values == ["B", "A", ["C", "D"], ["C", "D"]]
+    entries.sort()
+    assert tuple(entries) == (
+        UnicodeDataEntry(1, 3, "A"),
+        UnicodeDataEntry(5, 6, "B"),
+        UnicodeDataEntry(8, 8, "B"),
+        UnicodeDataEntry(10, 10, ["C", "D"]),
+        UnicodeDataEntry(12, 12, ["C", "D"]),
+    )
+    assert entries.to_set(lambda v: v == "B") == {5, 6, 8}
+    assert entries.value(10) == ["C", "D"]
+    # Equal lists are mapped to the same integer value.
+    entries.map_values_to_int()
+    assert entries.values_for_int() == ["A", "B", ["C", "D"]]
+    assert entries.value(10) == entries.value(12) == 2
+
+
+def test_map_values_to_int_order():
+    entries = UnicodeDataEntries(
+        entries=(
+            UnicodeDataEntry(5, 6, "B"),
+            UnicodeDataEntry(1, 3, "A"),
+        )
+    )
+    entries.sort()
+    copy = entries.copy()
+    entries.map_values_to_int()
+    # Integer values are in the order of entries.
+    assert entries.values_for_int() == ["A", "B"]
+    assert entries.value(1) == 0
+    assert entries.value(5) == 1
+    # The copy is not affected.
+    assert copy.values_for_int() is None
+    assert copy.value(1) == "A"
+
+
+def test_values():
+    class TestEntries(UnicodeDataEntries):
+        def missing_value(self, code: int):
+            return "M"
+
+    entries = TestEntries(
+        entries=(
+            UnicodeDataEntry(1, 3, "A"),
+            UnicodeDataEntry(5, 6, "B"),
+            UnicodeDataEntry(10, 10, "C"),
+        )
+    )
+    codes = list(range(12))
+    expect = [entries.value(code) for code in codes]
+    assert entries.values(codes) == expect
+    assert entries.values(reversed(codes)) == expect[::-1]
+    codes = [6, 2, 2, 10, 0, 11, 5, 4, 1]
+    assert entries.values(codes) == [entries.value(code) for code in codes]
+    assert entries.values_for_str("\x01\x04\x05") == ["A", "M", "B"]
+
+    # Shuffled code points, with hits of the cache after misses in gaps.
+    entries = UnicodeDataEntries(
+        entries=(
+            UnicodeDataEntry(0, 9, "A"),
+            UnicodeDataEntry(20, 29, "B"),
+            UnicodeDataEntry(40, 49, "C"),
+        )
+    )
+    assert entries.values([5, 35, 6, 25]) == ["A", None, "A", "B"]
+    codes = list(range(55))
+    random.Random(0).shuffle(codes)
+    codes += [5, 35, 6, 25, 45, 15, 8, 44]
+    assert entries.values(codes) == [entries.value(code) for code in codes]
+
+
 def test_missing_directive():
     lines = [
         "# test\n",
@@ -131,6 +277,14 @@ def test_missing_directive_lb():
         assert entries.value(code) == "PR"
     assert entries.value(0x20D0) == "XX"
 
+    assert tuple(entries.missing_entries()) == (
+        UnicodeDataEntry(0x0000, 0x209F, "XX"),
+        UnicodeDataEntry(0x20A0, 0x20CF, "PR"),
+        UnicodeDataEntry(0x20D0, 0x33FF, "XX"),
+        UnicodeDataEntry(0x3400, 0x4DBF, "ID"),
+        UnicodeDataEntry(0x4DC0, 0x10FFFF, "XX"),
+    )
+
 
 def test_missing_directive_vo():
     lines = [
@@ -145,6 +299,38 @@ def test_missing_directive_vo():
     assert entries.value(0x2460) == "R"
 
 
+def test_emoji_unite_flags():
+    lines = [
+        "# @missing: 0000..10FFFF  ; Emoji ; No\n",
+        "0023          ; Emoji                # E0.0   [1] (#️)\n",
+        "0030..0039    ; Emoji                # E0.0  [10] (0️..9️)\n",
+        "231A..231B    ; Emoji                # E0.6   [2] (⌚..⌛)\n",
+        "2328          ; Emoji                # E1.0   [1] (⌨️)\n",
+        "231A..231B    ; Emoji_Presentation   # E0.6   [2] (⌚..⌛)\n",
+        "0023          ; Emoji_Component      # E0.0   [1] (#️)\n",
+        "0030..0039    ; Emoji_Component      # E0.0  [10] (0️..9️)\n",
+        "2320..232F    ; Extended_Pictographic\n",
+        "2330..233F    ; Extended_Pictographic\n",
+    ]
+    entries = UnicodeEmojiDataEntries(lines=lines)
+
+    # Compare with uniting flags for each code point.
+    flags = {}
+    for entry in UnicodeDataEntry.from_lines(lines, converter=lambda v: EmojiType[v]):
+        for code in entry.range():
+            flags[code] = flags.get(code, EmojiType(0)) | entry.value
+    expects = tuple(UnicodeDataEntry.from_pairs(sorted(flags.items())))
+    assert tuple(entries) == expects
+
+    assert entries.value(0x22) == EmojiType(0)
+    assert entries.value(0x23) == EmojiType.Emoji | EmojiType.Emoji_Component
+    assert entries.value(0x231A) == EmojiType.Emoji | EmojiType.Emoji_Presentation
+    assert entries.value(0x231C) == EmojiType(0)
+    assert entries.value(0x2328) == EmojiType.Emoji | EmojiType.Extended_Pictographic
+    assert entries.value(0x2329) == EmojiType.Extended_Pictographic
+    assert entries.value(0x2340) == EmojiType(0)
+
+
 def test_normalie_no_changes():
     entries = UnicodeDataEntries(
         entries=(
@@ -171,12 +357,64 @@ def test_fill_missing_values():
     )
     entries.fill_missing_values()
     assert len(entries) == 2
-    assert entries._entries == (
+    assert tuple(entries) == (
         UnicodeDataEntry(0, 10, "A"),
         UnicodeDataEntry(11, 20, "B"),
     )
 
 
+def test_fill_missing_values_ranges():
+    lines = [
+        '#  - The unassigned code points in the following blocks default to "ID":\n',
+        "#         CJK Unified Ideographs Extension A: U+3400..U+4DBF\n",
+        '#  - The unassigned code points in the following block default to "PR":\n',
+        "#         Currency Symbols:                   U+20A0..U+20CF\n",
+        "# @missing: 0000..10FFFF; XX\n",
+        "0020..20A0     ; AL\n",
+        "20A2           ; PR\n",
+        "20D0..33FF     ; XX\n",
+        "3500..3501     ; AL\n",
+        "5000           ; AL\n",
+    ]
+    entries = UnicodeLineBreakDataEntries(lines=lines)
+    expects = tuple(
+        UnicodeDataEntry.from_values(
+            UnicodeDataEntry.values_for_code(iter(entries), entries.missing_value)
+        )
+    )
+    entries.fill_missing_values()
+    assert tuple(entries) == expects
+    assert tuple(entries) == (
+        UnicodeDataEntry(0x0000, 0x001F, "XX"),
+        UnicodeDataEntry(0x0020, 0x20A0, "AL"),
+        UnicodeDataEntry(0x20A1, 0x20CF, "PR"),
+        UnicodeDataEntry(0x20D0, 0x33FF, "XX"),
+        UnicodeDataEntry(0x3400, 0x34FF, "ID"),
+        UnicodeDataEntry(0x3500, 0x3501, "AL"),
+        UnicodeDataEntry(0x3502, 0x4DBF, "ID"),
+        UnicodeDataEntry(0x4DC0, 0x4FFF, "XX"),
+        UnicodeDataEntry(0x5000, 0x5000, "AL"),
+    )
+
+
+def test_merge():
+    entries = UnicodeDataEntry.merge(
+        (
+            UnicodeDataEntry(0, 0, None),
+            UnicodeDataEntry(1, 2, "A"),
+            UnicodeDataEntry(3, 3, "A"),
+            UnicodeDataEntry(5, 5, "A"),
+            UnicodeDataEntry(6, 6, None),
+            UnicodeDataEntry(7, 7, "B"),
+        )
+    )
+    assert tuple(entries) == (
+        UnicodeDataEntry(1, 3, "A"),
+        UnicodeDataEntry(5, 5, "A"),
+        UnicodeDataEntry(7, 7, "B"),
+    )
+
+
 def test_range_as_str():
     entry = UnicodeDataEntry(9, 9, "A")
     assert entry.range_as_str() == "0009"
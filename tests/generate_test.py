@@ -0,0 +1,110 @@
+import shutil
+
+import pytest
+
+from unicodedata_reader import *
+import unicodedata_reader.generate as generate
+
+from .conftest import root_dir
+
+
+def test_generate(reader, tmp_path):
+    templates = [
+        root_dir / "js" / "template.js",
+        root_dir / "js" / "template-2stage.js",
+    ]
+    generator = UnicodeDataGenerator(reader, max_workers=2)
+    paths = generator.generate(
+        ["line_break", "east_asian_width"], templates, output=tmp_path
+    )
+    names = sorted(path.name for path in paths)
+    assert names == [
+        "EastAsianWidth-2stage.js",
+        "EastAsianWidth.js",
+        "LineBreak-2stage.js",
+        "LineBreak.js",
+    ]
+
+    entries = reader.line_break()
+    entries.fill_missing_values()
+    entries.map_values_to_int()
+    expected = UnicodeDataCompressor(entries).substitute_template(templates[0])
+    assert (tmp_path / "LineBreak.js").read_text() == expected
+
+    # Unchanged files should be skipped.
+    assert generator.generate(["line_break"], templates, output=tmp_path) == []
+
+    # Changed templates and deleted files should be generated.
+    template = tmp_path / "template-bsearch.js"
+    shutil.copy(root_dir / "js" / "template-bsearch.js", template)
+    assert generator.generate(["line_break"], [template]) == [
+        tmp_path / "LineBreak-bsearch.js"
+    ]
+    template.write_text("// Changed\n" + template.read_text())
+    (tmp_path / "LineBreak.js").unlink()
+    paths = generator.generate(["line_break"], [templates[0], template], tmp_path)
+    assert paths == [tmp_path / "LineBreak.js", tmp_path / "LineBreak-bsearch.js"]
+
+    generator.force = True
+    assert len(generator.generate(["line_break"], templates, tmp_path)) == 2
+
+
+def test_generate_encoders(reader, tmp_path):
+    js_dir = root_dir / "js"
+    generator = UnicodeDataGenerator(reader, max_workers=1)
+    paths = generator.generate(
+        ["line_break"],
+        [js_dir / "template-bsearch.js", js_dir / "template-columns.js"],
+        output=tmp_path,
+    )
+    assert len(paths) == 2
+    compressor = UnicodeDataCompressor(generator._prepare(reader.line_break()))
+    assert (tmp_path / "LineBreak-bsearch.js").read_text() == (
+        compressor.substitute_template(js_dir / "template-bsearch.js")
+    )
+
+    # An encoder that the template doesn't decode is an error.
+    generator = UnicodeDataGenerator(reader, encoder="columns", max_workers=1)
+    with pytest.raises(ValueError):
+        generator.generate(
+            ["line_break"], [js_dir / "template-bsearch.js"], output=tmp_path
+        )
+
+
+def test_generate_script_extensions(reader, tmp_path):
+    generator = UnicodeDataGenerator(reader, max_workers=1)
+    paths = generator.generate(
+        ["script_extensions"], [root_dir / "js" / "template.js"], output=tmp_path
+    )
+    assert paths == [tmp_path / "ScriptExtensions.js"]
+
+
+def test_generate_binary(reader, tmp_path):
+    js_dir = root_dir / "js"
+    templates = [js_dir / "template-module.mjs", js_dir / "template.js"]
+    generator = UnicodeDataGenerator(reader, binary=True)
+    paths = generator.generate(["line_break"], templates, output=tmp_path)
+    assert len(paths) == 2
+    binary = tmp_path / "LineBreak.bin"
+    entries = generator._prepare(reader.line_break())
+    assert binary.read_bytes() == UnicodeDataCompressor(entries).compress()
+    # `template.js` doesn't load binary files.
+    assert "atob(" in (tmp_path / "LineBreak.js").read_text()
+
+    # A missing binary file is written even if other files are unchanged.
+    binary.unlink()
+    assert generator.generate(["line_break"], templates, output=tmp_path) == []
+    assert binary.read_bytes() == UnicodeDataCompressor(entries).compress()
+
+    # `template-module.mjs` needs `binary`, checked before generating files.
+    generator = UnicodeDataGenerator(reader, force=True)
+    with pytest.raises(ValueError, match="binary"):
+        generator.generate(["line_break"], templates, output=tmp_path / "none")
+    assert not (tmp_path / "none").exists()
+
+
+def test_generate_main(tmp_path):
+    template = root_dir / "js" / "template-bsearch.js"
+    generate.main(["general_category", "-t", str(template), "-o", str(tmp_path)])
+    assert (tmp_path / "GeneralCategory-bsearch.js").exists()
+    assert (tmp_path / ".generate.json").exists()
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from .conftest import root_dir
+
+
+def _run(statement: str) -> str:
+    result = subprocess.run(
+        (sys.executable, "-c", statement),
+        env=dict(os.environ, PYTHONPATH=str(root_dir / "src")),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    modules = _run(
+        "import sys\n"
+        "import unicodedata_reader as u\n"
+        "u.UnicodeDataEntries, u.UnicodeDataReader\n"
+        "print(' '.join(sorted(sys.modules)))"
+    ).split()
+    for module in (
+        "argparse",
+        "asyncio",
+        "base64",
+        "http.client",
+        "platformdirs",
+        "shutil",
+        "unicodedata_reader.cli",
+        "urllib.request",
+        "zipfile",
+    ):
+        assert module not in modules
+
+
+def test_default_reader_is_lazy():
+    assert _run(
+        "import unicodedata_reader as u\n"
+        "print(type(u.UnicodeDataReader.__dict__['default']).__name__)\n"
+        "print(type(u.UnicodeDataReader.default).__name__)\n"
+        "print(type(u.UnicodeDataReader.__dict__['default']).__name__)"
+    ).split() == [
+        "_DefaultReader",
+        "UnicodeDataCachedReader",
+        "UnicodeDataCachedReader",
+    ]
+
+
+def test_all():
+    import unicodedata_reader
+
+    for name in unicodedata_reader.__all__:
+        assert getattr(unicodedata_reader, name) is not None
+    assert "UnicodeDataReader" in dir(unicodedata_reader)
+    with pytest.raises(AttributeError):
+        unicodedata_reader.no_such_name
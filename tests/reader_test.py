@@ -1,4 +1,22 @@
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import urllib.error
+import zipfile
+
+import pytest
+
 from unicodedata_reader import *
+from unicodedata_reader.line_break import UnicodeLineBreakDataCli
+
+from .conftest import cache_dir
+
+
+class _NoDownloadReader(UnicodeDataReader):
+    def read_lines(self, name: str):
+        raise AssertionError(f"Unexpected download: {name}")
 
 
 def test_hex():
@@ -28,3 +46,317 @@ def test_context():
         assert original_default != in_context
         assert UnicodeDataReader.default == in_context
     assert UnicodeDataReader.default == original_default
+
+
+def test_entries_cache(tmp_path, monkeypatch):
+    shutil.copy(cache_dir / "LineBreak", tmp_path / "LineBreak")
+    reader = UnicodeDataCachedReader(_NoDownloadReader(), cache_dir=tmp_path)
+    entries_cache = tmp_path / "LineBreak.entries"
+    assert not entries_cache.exists()
+
+    lb = reader.line_break()
+    assert lb.value(0x41) == "AL"
+    assert entries_cache.exists()
+
+    # The second read should not parse the file.
+    def from_lines(*args, **kwargs):
+        raise AssertionError("Unexpected parse")
+
+    with monkeypatch.context() as m:
+        m.setattr(UnicodeDataEntry, "from_lines", from_lines)
+        lb = reader.line_break()
+    assert isinstance(lb, UnicodeLineBreakDataEntries)
+    assert lb.value(0x41) == "AL"
+    assert lb.value(0x3400) == "ID"
+    assert lb.value(0x378) == "XX"
+
+    # The cache has no pickles, and `pickle` files are ignored.
+    assert entries_cache.read_bytes().startswith(b"UCDE")
+    entries_cache.write_bytes(pickle.dumps(lb))
+    with pytest.raises(AssertionError, match="Unexpected parse"):
+        with monkeypatch.context() as m:
+            m.setattr(UnicodeDataEntry, "from_lines", from_lines)
+            reader.line_break()
+    assert reader.line_break().value(0x41) == "AL"
+
+    # Changing the parser version invalidates the cache.
+    monkeypatch.setattr(UnicodeLineBreakDataEntries, "parser_version", 1000)
+    with pytest.raises(AssertionError, match="Unexpected parse"):
+        with monkeypatch.context() as m:
+            m.setattr(UnicodeDataEntry, "from_lines", from_lines)
+            reader.line_break()
+    reader.line_break()
+
+    # Changing the file invalidates the cache.
+    path = tmp_path / "LineBreak"
+    assert reader.line_break().value(0x22) == "QU"
+    path.write_text(
+        path.read_text().replace("0022           ; QU", "0022           ; AL")
+    )
+    assert reader.line_break().value(0x22) == "AL"
+
+
+def test_entries_cache_values(tmp_path, monkeypatch):
+    shutil.copy(cache_dir / "ScriptExtensions", tmp_path / "ScriptExtensions")
+    reader = UnicodeDataCachedReader(_NoDownloadReader(), cache_dir=tmp_path)
+    expected = list(reader.script_extensions())
+    assert (tmp_path / "ScriptExtensions.entries").exists()
+    cached = reader.script_extensions()
+    assert isinstance(cached, UnicodeScriptExtensionsDataEntries)
+    assert list(cached) == expected
+    assert isinstance(cached.value(0x3001), list)
+
+
+class _CountingReader(UnicodeDataReader):
+    def __init__(self, reader: UnicodeDataReader):
+        self._reader = reader
+        self.counts = {}
+
+    def read_lines(self, name: str):
+        self.counts[name] = self.counts.get(name, 0) + 1
+        return self._reader.read_lines(name)
+
+
+def test_memoized_reader(reader):
+    counting = _CountingReader(reader)
+    memo = UnicodeDataMemoizedReader(counting)
+    lb = memo.line_break()
+    lb2 = memo.line_break()
+    assert counting.counts == {"LineBreak": 1}
+    assert lb is not lb2
+    assert isinstance(lb2, UnicodeLineBreakDataEntries)
+    assert lb2.value(0x378) == "XX"
+
+    # Changes to one of them do not affect others.
+    lb.fill_missing_values()
+    lb.map_values_to_int()
+    assert isinstance(lb.value(0x41), int)
+    assert memo.line_break().value(0x41) == "AL"
+    assert lb2.value(0x41) == "AL"
+
+    memo.invalidate("LineBreak")
+    memo.line_break()
+    assert counting.counts == {"LineBreak": 2}
+    memo.invalidate()
+    memo.line_break()
+    assert counting.counts == {"LineBreak": 3}
+
+
+def test_memoized_reader_lru(reader):
+    counting = _CountingReader(reader)
+    memo = UnicodeDataMemoizedReader(counting, maxsize=2)
+    memo.line_break()
+    memo.scripts()
+    memo.line_break()
+    memo.east_asian_width()  # Discards `Scripts`.
+    memo.line_break()
+    memo.scripts()
+    assert counting.counts == {"LineBreak": 1, "Scripts": 2, "EastAsianWidth": 1}
+
+
+def test_memoized_reader_context(reader):
+    memo = UnicodeDataMemoizedReader(reader)
+    other = UnicodeDataMemoizedReader(_NoDownloadReader())
+    assert UnicodeDataReader.default.line_break().value(0x41) == "AL"
+    with UnicodeDataReader.Context(memo):
+        assert UnicodeDataReader.default.line_break().value(0x41) == "AL"
+        with UnicodeDataReader.Context(other):
+            with pytest.raises(AssertionError, match="Unexpected download"):
+                UnicodeDataReader.default.line_break()
+        assert UnicodeDataReader.default.line_break().value(0x41) == "AL"
+
+
+_names = (
+    "EastAsianWidth",
+    "LineBreak",
+    "ScriptExtensions",
+    "Scripts",
+    "extracted/DerivedGeneralCategory",
+    "extracted/DerivedName",
+)
+
+
+def test_read_lines_http(server):
+    reader = UnicodeDataReader(server.url_template)
+    lines = reader.read_lines("LineBreak")
+    assert lines == (cache_dir / "LineBreak").read_text().splitlines(keepends=True)
+    reader.read_lines("Scripts")
+    # The connection is kept alive.
+    assert server.connections == 1
+
+    with pytest.raises(urllib.error.HTTPError):
+        reader.read_lines("NotFound")
+
+
+def test_read_lines_proxy(server, monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    proxy = server.url_template.removesuffix("/{0}.txt")
+    monkeypatch.setenv("http_proxy", proxy)
+    reader = UnicodeDataReader("http://unicode.invalid/{0}.txt")
+    lines = reader.read_lines("LineBreak")
+    assert lines == (cache_dir / "LineBreak").read_text().splitlines(keepends=True)
+    assert server.requests == {"LineBreak": 1}
+
+    # Hosts in `no_proxy` are not read through the proxy.
+    monkeypatch.setenv("no_proxy", "unicode.invalid")
+    with pytest.raises(OSError):
+        reader.read_lines("LineBreak")
+    assert server.requests == {"LineBreak": 1}
+
+
+def test_prefetch(server, tmp_path):
+    reader = UnicodeDataCachedReader(
+        UnicodeDataReader(server.url_template), cache_dir=tmp_path
+    )
+    reader.prefetch(_names, max_workers=3)
+    assert server.requests == {name: 1 for name in _names}
+    assert server.connections <= 3
+    for name in _names:
+        assert (tmp_path / name).read_bytes() == (cache_dir / name).read_bytes()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    entries = reader.load_many(["line_break", "general_category", "scripts"])
+    assert server.requests == {name: 1 for name in _names}
+    assert entries["line_break"].value(0x41) == "AL"
+    assert entries["general_category"].value(0x41) == "Lu"
+    assert entries["scripts"].name == "Scripts"
+
+
+@pytest.mark.parametrize("prefix", ["", "ucd/"])
+def test_zip_reader(tmp_path, prefix):
+    path = tmp_path / "UCD.zip"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zip:
+        for name in _names:
+            zip.write(cache_dir / name, f"{prefix}{name}.txt")
+
+    with UnicodeDataZipReader(path) as reader:
+        assert reader.read_lines("LineBreak") == (
+            (cache_dir / "LineBreak").read_text().splitlines(keepends=True)
+        )
+        assert reader.line_break().value(0x41) == "AL"
+        assert reader.general_category().value(0x41) == "Lu"
+        assert reader.name().value(0x20) == "SPACE"
+        with pytest.raises(FileNotFoundError):
+            reader.read_lines("emoji/emoji-data")
+        with pytest.raises(FileNotFoundError):
+            reader.read_lines("DerivedName")
+
+
+def _read_all(url_template, cache_dir, start):
+    reader = UnicodeDataCachedReader(UnicodeDataReader(url_template), cache_dir)
+    start.wait()
+    for name in _names:
+        lines = reader.read_lines(name)
+        assert lines == (cache_dir / name).read_text().splitlines(keepends=True)
+    reader.line_break()
+
+
+def test_cache_multiprocess(server, tmp_path):
+    server.delay = 0.05
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    processes = [
+        context.Process(target=_read_all, args=(server.url_template, tmp_path, start))
+        for _ in range(6)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    # Each file should be downloaded only once.
+    assert server.requests == {name: 1 for name in _names}
+    for name in _names:
+        assert (tmp_path / name).read_bytes() == (cache_dir / name).read_bytes()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_version():
+    assert UnicodeDataReader().get_url("LineBreak") == (
+        "https://www.unicode.org/Public/UNIDATA/LineBreak.txt"
+    )
+    reader = UnicodeDataReader(version="15.0.0")
+    assert reader.version == "15.0.0"
+    assert reader.get_url("LineBreak") == (
+        "https://www.unicode.org/Public/15.0.0/ucd/LineBreak.txt"
+    )
+    assert UnicodeDataCachedReader(reader).version == "15.0.0"
+    assert UnicodeDataMemoizedReader(reader).version == "15.0.0"
+
+
+def test_version_cache(server, tmp_path):
+    readers = [
+        UnicodeDataCachedReader(
+            UnicodeDataReader(server.url_template, version=version), tmp_path
+        )
+        for version in ("14.0.0", "15.0.0")
+    ]
+    entries = [reader.line_break() for reader in readers]
+    assert server.requests == {"LineBreak": 2}
+    assert (tmp_path / "14.0.0" / "LineBreak").exists()
+    assert (tmp_path / "15.0.0" / "LineBreak").exists()
+    assert not (tmp_path / "LineBreak").exists()
+
+    # Values are shared across versions.
+    values = entries[0].values_for_str("A")[0], entries[1].values_for_str("A")[0]
+    assert values[0] == "AL"
+    assert values[0] is values[1]
+
+    # The parsed cache also shares values.
+    cached = [reader.line_break() for reader in readers]
+    assert server.requests == {"LineBreak": 2}
+    assert cached[0].value(0x41) is cached[1].value(0x41)
+
+
+def test_compiled_reader(server, tmp_path):
+    def compiled_reader():
+        return UnicodeDataCompiledReader(
+            UnicodeDataCachedReader(UnicodeDataReader(server.url_template), tmp_path)
+        )
+
+    reader = compiled_reader()
+    lb = reader.line_break()
+    assert isinstance(lb, UnicodeDataCompiledEntries)
+    assert lb.value(0x41) == "AL"
+    assert reader.line_break() is lb
+    table = tmp_path / "LineBreak.table"
+    assert table.exists()
+    assert server.requests == {"LineBreak": 1}
+
+    # Other readers map the saved table without parsing.
+    (tmp_path / "LineBreak.entries").unlink()
+    lb2 = compiled_reader().line_break()
+    assert isinstance(lb2._stage2, memoryview)
+    assert lb2.values_for_str("A(") == ["AL", "OP"]
+    assert not (tmp_path / "LineBreak.entries").exists()
+
+    # The table is compiled again when the source is updated.
+    source = tmp_path / "LineBreak"
+    source.write_text(source.read_text().replace("0022           ; QU", "0022  ; AL"))
+    os.utime(source, ns=(table.stat().st_mtime_ns + 10**9,) * 2)
+    assert compiled_reader().line_break().value(0x22) == "AL"
+    assert server.requests == {"LineBreak": 1}
+
+
+def test_compiled_reader_default(tmp_path, monkeypatch, capsys):
+    for name in ("EastAsianWidth", "LineBreak"):
+        shutil.copy(cache_dir / name, tmp_path / name)
+    cached_reader = UnicodeDataCachedReader(_NoDownloadReader(), cache_dir=tmp_path)
+    reader = UnicodeDataCompiledReader(cached_reader)
+    with UnicodeDataReader.Context(reader):
+        wide = Set.east_asian_width("W", "F")
+        assert 0x3042 in wide and 0x41 not in wide
+
+        monkeypatch.setattr(sys, "argv", ["lb", "A("])
+        UnicodeLineBreakDataCli().main()
+    output = capsys.readouterr().out.splitlines()
+    assert output[1].split("\t")[:3] == ["U0041", "A", "AL"]
+    assert output[2].split("\t")[:3] == ["U0028", "(", "OP"]
+
+    # The same as entries with missing values filled.
+    entries = cached_reader.east_asian_width()
+    entries.fill_missing_values()
+    assert list(wide) == list(Set(entries, lambda v: v in ("W", "F")))
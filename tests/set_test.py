@@ -96,3 +96,47 @@ def test_set_script_extensions():
     assert 0x1CD6 in han_or_deva
     assert 0x1CF7 not in han_or_deva
     assert 0x3002 in han_or_deva
+
+
+def test_set_add_join():
+    s = ur.Set()
+    for code in (5, 3, 4, 1, 7, 6, 2):
+        s.add(code)
+    assert list(s) == [1, 2, 3, 4, 5, 6, 7]
+    assert s._list == [1, 8]
+    s.remove(4)
+    s.remove(1)
+    s.remove(7)
+    assert list(s) == [2, 3, 5, 6]
+    assert 4 not in s
+    assert 8 not in s
+
+
+def test_set_operators():
+    def set_of(*codes):
+        s = ur.Set()
+        for code in codes:
+            s.add(code)
+        return s
+
+    s = set_of(1, 2, 3, 5, 6, 10)
+    s |= set_of(4, 7, 12)
+    assert list(s) == [1, 2, 3, 4, 5, 6, 7, 10, 12]
+    s &= set_of(0, 1, 3, 4, 5, 11, 12)
+    assert list(s) == [1, 3, 4, 5, 12]
+    s -= set_of(3, 4, 12, 13)
+    assert list(s) == [1, 5]
+
+
+def test_set_from_unsorted_entries():
+    entries = ur.UnicodeDataEntries(
+        entries=(
+            ur.UnicodeDataEntry(10, 20, "A"),
+            ur.UnicodeDataEntry(1, 3, "A"),
+            ur.UnicodeDataEntry(4, 5, "A"),
+            ur.UnicodeDataEntry(6, 6, "B"),
+            ur.UnicodeDataEntry(15, 25, "A"),
+        )
+    )
+    s = ur.Set(entries, lambda v: v == "A")
+    assert s._list == [1, 6, 10, 26]
@@ -0,0 +1,58 @@
+import importlib.util
+
+import pytest
+
+from unicodedata_reader import *
+import unicodedata_reader.snapshot as snapshot
+
+
+def _import(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_snapshot_python(reader, tmp_path):
+    snapshot = UnicodeDataSnapshot.from_reader(
+        reader, ["line_break", "east_asian_width"]
+    )
+    path = tmp_path / "ucd_snapshot.py"
+    snapshot.save(path)
+    module = _import(path, "ucd_snapshot")
+    assert module.unicode_version is None
+    assert module.__all__ == ["unicode_version", "line_break", "east_asian_width"]
+    lb = reader.line_break()
+    assert module.line_break.name == "LineBreak"
+    assert module.line_break.values_for_str("A(あ") == ["AL", "OP", "ID"]
+    assert module.line_break[0x378] == lb.value(0x378) == "XX"
+    assert module.east_asian_width[0x3042] == "W"
+
+
+def test_snapshot_tables(reader, tmp_path):
+    snapshot = UnicodeDataSnapshot.from_reader(reader, ["line_break"])
+    snapshot.save(tmp_path)
+    table = UnicodeDataCompiledEntries.load(tmp_path / "line_break.table")
+    assert table[0x41] == "AL"
+
+
+def test_snapshot_script_extensions(reader, tmp_path):
+    snapshot = UnicodeDataSnapshot.from_reader(reader, ["script_extensions"])
+    path = tmp_path / "ucd_scx.py"
+    snapshot.save(path)
+    module = _import(path, "ucd_scx")
+    scx = reader.script_extensions()
+    assert module.script_extensions[0x3001] == scx.value(0x3001)
+    assert "Hira" in module.script_extensions[0x3001]
+    assert module.script_extensions[0x41] == scx.value(0x41)
+
+
+def test_snapshot_main(tmp_path):
+    path = tmp_path / "ucd_main.py"
+    snapshot.main(["scripts", "line_break", "-o", str(path)])
+    module = _import(path, "ucd_main")
+    assert module.scripts[0x3042] == "Hiragana"
+    assert module.line_break[0x41] == "AL"
+
+    with pytest.raises(SystemExit):
+        snapshot.main(["read_lines", "-o", str(path)])